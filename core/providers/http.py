@@ -0,0 +1,104 @@
+from __future__ import annotations
+import os
+import socket
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+
+# 하나의 Session을 세 provider가 공유 → 호스트별 커넥션 풀 재사용 (TCP/TLS handshake 절감)
+PROVIDER_HOSTS = (
+    "https://ws.audioscrobbler.com/",
+    "https://itunes.apple.com/",
+    "https://musicbrainz.org/",
+)
+
+DEFAULT_USER_AGENT = "music-rec-app/0.1 ( https://example.com )"
+
+
+class ProviderError(RuntimeError):
+    """API-level error reported by a provider (e.g. Last.fm {"error": ...})."""
+
+
+# retry 소진 후에도 남는 실패: 네트워크/HTTP, provider API 에러, 깨진 JSON
+PROVIDER_ERRORS = (requests.RequestException, ProviderError, ValueError)
+
+_shared_session: Optional[requests.Session] = None
+_shared_lock = threading.Lock()
+
+
+class _TunedAdapter(HTTPAdapter):
+    # urllib3 기본값(TCP_NODELAY) + TCP keep-alive: 풀에 남은 idle 연결이 끊기지 않게
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _make_adapter() -> HTTPAdapter:
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    return _TunedAdapter(pool_connections=8, pool_maxsize=32, max_retries=retry)
+
+
+def build_session() -> requests.Session:
+    s = requests.Session()
+    for prefix in PROVIDER_HOSTS:
+        s.mount(prefix, _make_adapter())
+    # MusicBrainz는 User-Agent 권장/사실상 필수 → 요청마다가 아니라 Session에 한 번만 설정
+    s.headers["User-Agent"] = os.getenv("APP_USER_AGENT") or DEFAULT_USER_AGENT
+    # JSON 응답은 gzip으로 5~10배 줄어듦
+    s.headers["Accept-Encoding"] = "gzip, deflate"
+    s.headers["Connection"] = "keep-alive"
+    return s
+
+
+def shared_session() -> requests.Session:
+    """
+    Process-wide Session shared by all provider clients.
+    (Created lazily so .env is already loaded when User-Agent is read.)
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_lock:
+            if _shared_session is None:
+                _shared_session = build_session()
+    return _shared_session
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: at most `rate` calls/sec (bursts up to `burst`).
+    acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
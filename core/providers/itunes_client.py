@@ -1,34 +1,57 @@
 from __future__ import annotations
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
-from utils.cache import TTLCache
+from utils.fastjson import loads
+from utils.dicts import dig
+from utils.cache import TTLCache, InFlight, make_key
+from core.providers.http import shared_session
 
 
 class ITunesClient:
     BASE = "https://itunes.apple.com/search"
 
-    def __init__(self, cache: Optional[TTLCache] = None):
+    def __init__(self, cache: Optional[TTLCache] = None, session: Optional[requests.Session] = None):
         self.cache = cache or TTLCache(ttl_seconds=3600)
+        self.session = session or shared_session()
+        self._inflight = InFlight()
+
+    def _search(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        cache_key = make_key("itunes:", params)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        def fetch() -> List[Dict[str, Any]]:
+            r = self.session.get(self.BASE, params=params, timeout=15)
+            r.raise_for_status()
+            data = loads(r.content) if r.content else {}
+            res = dig(data, "results") or []
+            self.cache.set(cache_key, res)
+            return res
+
+        return self._inflight.do(cache_key, fetch)
 
     def search_track(self, track: str, artist: str, country: str = "KR") -> Optional[Dict[str, Any]]:
         term = f"{track} {artist}".strip()
-        params = {
+        res = self._search({
             "term": term,
             "media": "music",
             "entity": "song",
             "limit": 1,
             "country": country,
-        }
-        cache_key = "itunes:" + "&".join([f"{k}={params[k]}" for k in sorted(params.keys())])
-        cached = self.cache.get(cache_key)
-        if cached is not None:
-            return cached
+        })
+        return res[0] if res else None
 
-        r = requests.get(self.BASE, params=params, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        res = (data or {}).get("results") or []
-        item = res[0] if res else None
-        self.cache.set(cache_key, item)
-        return item
+    def search_artist_songs(self, artist: str, limit: int = 25, country: str = "KR") -> List[Dict[str, Any]]:
+        """
+        One search for many songs of an artist (batch preview lookup).
+        """
+        return self._search({
+            "term": artist.strip(),
+            "media": "music",
+            "entity": "song",
+            "attribute": "artistTerm",
+            "limit": limit,
+            "country": country,
+        })
@@ -3,29 +3,64 @@ import os
 import requests
 from typing import Any, Dict, List, Optional
 
+from core.providers.http import shared_session, ProviderError, RateLimiter
+from utils.fastjson import loads
+from utils.dicts import dig
+from utils.cache import TTLCache, InFlight, make_key
+
+
+class LastFMError(ProviderError):
+    pass
+
 
 class LastFMClient:
     BASE_URL = "https://ws.audioscrobbler.com/2.0/"
+    # Last.fm 권장: 5 req/s 이하 (모든 인스턴스 공유)
+    _rate_limiter = RateLimiter(rate=5.0, burst=5)
 
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 10):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = 10,
+        session: Optional[requests.Session] = None,
+        cache: Optional[TTLCache] = None,
+    ):
         self.api_key = api_key or os.getenv("LASTFM_API_KEY")
         if not self.api_key:
             raise RuntimeError("LASTFM_API_KEY is missing. Put it in .env or environment variables.")
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = session or shared_session()
+        self.cache = cache or TTLCache(ttl_seconds=600)
+        self._inflight = InFlight()
 
     def _get(self, params: Dict[str, Any]) -> Dict[str, Any]:
         q = dict(params)
         q["api_key"] = self.api_key
         q["format"] = "json"
 
+        # cache key / in-flight key: api_key 제외한 params 기준
+        cache_key = make_key(f"lastfm:{params.get('method')}:", params)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        def fetch() -> Dict[str, Any]:
+            data = self._fetch(q)
+            self.cache.set(cache_key, data)
+            return data
+
+        # 같은 요청이 동시에 진행 중이면 그 결과를 공유
+        return self._inflight.do(cache_key, fetch)
+
+    def _fetch(self, q: Dict[str, Any]) -> Dict[str, Any]:
+        self._rate_limiter.acquire()
         r = self.session.get(self.BASE_URL, params=q, timeout=self.timeout)
         r.raise_for_status()
-        data = r.json()
+        data = loads(r.content) if r.content else {}
 
         # Last.fm errors come as: {"error":..., "message":...}
         if isinstance(data, dict) and data.get("error"):
-            raise RuntimeError(f"Last.fm error: {data.get('message')} (code={data.get('error')})")
+            raise LastFMError(f"Last.fm error: {data.get('message')} (code={data.get('error')})")
         return data if isinstance(data, dict) else {}
 
     # ------------------------------
@@ -40,7 +75,7 @@ class LastFMClient:
             "autocorrect": 1,
         })
         # expected: {"similartracks": {"track": [...]}}
-        similar = (data.get("similartracks") or {}).get("track")
+        similar = dig(data, "similartracks", "track")
         if isinstance(similar, list):
             return similar
         if isinstance(similar, dict):
@@ -54,18 +89,18 @@ class LastFMClient:
             "artist": artist,
             "autocorrect": 1,
         })
-        tags_obj = ((data.get("toptags") or {}).get("tag")) or []
+        tags_obj = dig(data, "toptags", "tag") or []
         tags: List[str] = []
 
         if isinstance(tags_obj, list):
             for t in tags_obj[:limit]:
-                name = (t or {}).get("name")
-                if name:
-                    tags.append(str(name))
+                name = dig(t, "name")
+                if name and isinstance(name, str):
+                    tags.append(name)
         elif isinstance(tags_obj, dict):
             name = tags_obj.get("name")
-            if name:
-                tags.append(str(name))
+            if name and isinstance(name, str):
+                tags.append(name)
 
         return tags
 
@@ -79,7 +114,7 @@ class LastFMClient:
             "limit": limit,
             "autocorrect": 1,
         })
-        sim = (data.get("similarartists") or {}).get("artist")
+        sim = dig(data, "similarartists", "artist")
         if isinstance(sim, list):
             return sim
         if isinstance(sim, dict):
@@ -93,7 +128,7 @@ class LastFMClient:
             "limit": limit,
             "autocorrect": 1,
         })
-        tracks = ((data.get("toptracks") or {}).get("track")) or []
+        tracks = dig(data, "toptracks", "track") or []
         if isinstance(tracks, list):
             return tracks
         if isinstance(tracks, dict):
@@ -106,17 +141,17 @@ class LastFMClient:
             "artist": artist,
             "autocorrect": 1,
         })
-        tags_obj = ((data.get("toptags") or {}).get("tag")) or []
+        tags_obj = dig(data, "toptags", "tag") or []
         tags: List[str] = []
 
         if isinstance(tags_obj, list):
             for t in tags_obj[:limit]:
-                name = (t or {}).get("name")
-                if name:
-                    tags.append(str(name))
+                name = dig(t, "name")
+                if name and isinstance(name, str):
+                    tags.append(name)
         elif isinstance(tags_obj, dict):
             name = tags_obj.get("name")
-            if name:
-                tags.append(str(name))
+            if name and isinstance(name, str):
+                tags.append(name)
 
         return tags
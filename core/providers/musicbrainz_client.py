@@ -2,38 +2,46 @@ from __future__ import annotations
 import requests
 from typing import Optional, Dict, Any, List
 
-from utils.cache import TTLCache
+from utils.fastjson import loads
+from utils.dicts import dig
+from utils.cache import TTLCache, InFlight, make_key
+from core.providers.http import shared_session, RateLimiter
 
 
 class MusicBrainzClient:
     BASE = "https://musicbrainz.org/ws/2/"
+    # MusicBrainz 정책: IP당 1 req/s (모든 인스턴스 공유) → 초과 시 503 + retry 발생
+    _rate_limiter = RateLimiter(rate=1.0)
 
-    def __init__(self, cache: Optional[TTLCache] = None):
+    def __init__(self, cache: Optional[TTLCache] = None, session: Optional[requests.Session] = None):
         self.cache = cache or TTLCache(ttl_seconds=3600)
+        # User-Agent는 shared Session 헤더에 한 번만 설정됨 (core/providers/http.py)
+        self.session = session or shared_session()
+        self._inflight = InFlight()
 
     def _get(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         params = dict(params)
         params["fmt"] = "json"
 
-        cache_key = "mb:" + endpoint + "?" + "&".join([f"{k}={params[k]}" for k in sorted(params.keys())])
+        cache_key = make_key("mb:" + endpoint + "?", params)
         cached = self.cache.get(cache_key)
         if cached is not None:
             return cached
 
-        headers = {
-            # MusicBrainz는 User-Agent 권장/사실상 필수
-            "User-Agent": "music-rec-app/0.1 ( https://example.com )"
-        }
-        r = requests.get(self.BASE + endpoint, params=params, headers=headers, timeout=15)
-        r.raise_for_status()
-        data = r.json()
-        self.cache.set(cache_key, data)
-        return data
+        def fetch() -> Dict[str, Any]:
+            self._rate_limiter.acquire()
+            r = self.session.get(self.BASE + endpoint, params=params, timeout=15)
+            r.raise_for_status()
+            data = loads(r.content) if r.content else {}
+            self.cache.set(cache_key, data)
+            return data
+
+        return self._inflight.do(cache_key, fetch)
 
     def search_recording(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         data = self._get("recording/", {"query": query, "limit": limit})
-        return (data or {}).get("recordings") or []
+        return dig(data, "recordings") or []
 
     def search_artist(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         data = self._get("artist/", {"query": query, "limit": limit})
-        return (data or {}).get("artists") or []
+        return dig(data, "artists") or []
@@ -1,20 +1,62 @@
 from __future__ import annotations
-from typing import List, Optional
+import logging
+import os
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from models.dto import RecommendResult, TrackRecommendation
-from utils.text import parse_user_query, normalize_space
-from utils.cache import TTLCache
+from utils.text import parse_user_query, normalize_space, normalize_title
+from utils.cache import TTLCache, PersistentTTLCache
+from utils.dicts import dig
 from core.providers.lastfm_client import LastFMClient
 from core.providers.itunes_client import ITunesClient
 from core.providers.musicbrainz_client import MusicBrainzClient
+from core.providers.http import PROVIDER_ERRORS
+
+logger = logging.getLogger(__name__)
 
 
 class RecommendService:
-    def __init__(self):
-        cache = TTLCache(ttl_seconds=600)
-        self.lastfm = LastFMClient()
+    # 동시 네트워크 요청 수 (provider rate limit 고려, Session pool_maxsize 이하)
+    MAX_WORKERS = 6
+
+    # cache key prefix -> TTL(sec). 잘 안 바뀌는 데이터일수록 길게
+    _ttl_policy = {
+        "itunes:": 14 * 24 * 3600,      # preview/artwork URL: 거의 불변
+        "mb:artist/": 7 * 24 * 3600,
+        "mb:recording/": 7 * 24 * 3600,
+        "lastfm:artist.getTopTags:": 3 * 24 * 3600,
+        "lastfm:track.getTopTags:": 3 * 24 * 3600,
+        "lastfm:artist.getTopTracks:": 24 * 3600,
+        "lastfm:artist.getSimilar:": 24 * 3600,
+        "lastfm:track.getSimilar:": 6 * 3600,
+    }
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        cache = self._make_cache(cache_dir)
+        self.lastfm = LastFMClient(cache=cache)
         self.itunes = ITunesClient(cache=cache)
         self.mb = MusicBrainzClient(cache=cache)
+        self._pool = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="reco-io")
+
+        # 정규화된 입력 -> MB 해석 결과 (같은 입력 재검색 시 MB 왕복 생략)
+        self._resolve_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._artist_cache: Dict[str, str] = {}
+
+    def _make_cache(self, cache_dir: Optional[str]) -> TTLCache:
+        # 재실행 시에도 iTunes/MusicBrainz 결과 재사용 (~/.cache/music_rec_app)
+        cache_dir = cache_dir or os.path.join(os.path.expanduser("~"), ".cache", "music_rec_app")
+        try:
+            return PersistentTTLCache(
+                os.path.join(cache_dir, "http_cache.sqlite3"),
+                ttl_seconds=600,
+                ttl_policy=self._ttl_policy,
+            )
+        except (OSError, sqlite3.Error):
+            return TTLCache(ttl_seconds=600, ttl_policy=self._ttl_policy)
 
     def recommend(self, user_text: str, limit_tracks: int = 20) -> RecommendResult:
         raw = normalize_space(user_text)
@@ -25,8 +67,17 @@ class RecommendService:
 
         # 1) Track+Artist 모드 우선 시도
         if track and artist:
+            # MB 해석과 동시에 입력 그대로 similar tracks를 미리 조회 (대부분 이름이 안 바뀜)
+            speculative = self._pool.submit(self.lastfm.track_get_similar, track, artist, limit_tracks)
             resolved_track, resolved_artist = self._resolve_track_artist(track, artist)
-            items = self._recommend_by_track(resolved_track, resolved_artist, limit_tracks)
+
+            raws = None
+            if (self._query_key(resolved_track), self._query_key(resolved_artist)) == (
+                self._query_key(track),
+                self._query_key(artist),
+            ):
+                raws = speculative.result()
+            items = self._recommend_by_track(resolved_track, resolved_artist, limit_tracks, raws=raws)
             if items:
                 self._sort_items(items)
                 return RecommendResult(
@@ -60,47 +111,104 @@ class RecommendService:
             message=f"'{resolved_artist}'(아티스트) 기반 추천",
         )
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _query_key(s: str) -> str:
+        # "Radiohead " / "radiohead" 같은 입력이 동일 MB 조회로 모이도록
+        return normalize_space(s).casefold()
+
     def _resolve_track_artist(self, track: str, artist: str) -> tuple[str, str]:
+        key = (self._query_key(track), self._query_key(artist))
+        hit = self._resolve_cache.get(key)
+        if hit is not None:
+            return hit
         try:
-            q = f'recording:"{track}" AND artist:"{artist}"'
+            q = f'recording:"{key[0]}" AND artist:"{key[1]}"'
             recs = self.mb.search_recording(q, limit=3)
             if recs:
                 best = recs[0]
                 title = best.get("title") or track
                 credit = (best.get("artist-credit") or [])
                 if credit and isinstance(credit, list):
-                    name = (credit[0] or {}).get("name")
+                    name = dig(credit[0], "name")
                 else:
                     name = None
-                return normalize_space(title), normalize_space(name or artist)
-        except Exception:
-            pass
+                resolved = (normalize_space(title), normalize_space(name or artist))
+                self._resolve_cache[key] = resolved
+                return resolved
+        except PROVIDER_ERRORS as e:
+            logger.warning("MusicBrainz recording lookup failed (%s - %s): %s", track, artist, e)
         return track, artist
 
     def _resolve_artist(self, artist: str) -> Optional[str]:
+        key = self._query_key(artist)
+        hit = self._artist_cache.get(key)
+        if hit is not None:
+            return hit
         try:
-            arts = self.mb.search_artist(f'artist:"{artist}"', limit=3)
+            arts = self.mb.search_artist(f'artist:"{key}"', limit=3)
             if arts:
-                return normalize_space(arts[0].get("name") or artist)
-        except Exception:
-            return None
+                resolved = normalize_space(arts[0].get("name") or artist)
+                self._artist_cache[key] = resolved
+                return resolved
+        except PROVIDER_ERRORS as e:
+            logger.warning("MusicBrainz artist lookup failed (%s): %s", artist, e)
         return None
 
+    def _search_preview(self, it: TrackRecommendation) -> Optional[Dict[str, Any]]:
+        try:
+            return self.itunes.search_track(it.track, it.artist, country="KR")
+        except PROVIDER_ERRORS as e:
+            logger.warning("iTunes track search failed (%s - %s): %s", it.track, it.artist, e)
+            return None
+
+    def _search_artist_songs(self, artist: str) -> List[Dict[str, Any]]:
+        try:
+            return self.itunes.search_artist_songs(artist, limit=25, country="KR")
+        except PROVIDER_ERRORS as e:
+            logger.warning("iTunes artist search failed (%s): %s", artist, e)
+            return []
+
+    def _apply_preview(self, it: TrackRecommendation, hit: Optional[Dict[str, Any]]) -> None:
+        if hit:
+            it.preview_url = hit.get("previewUrl")
+            it.artwork_url = hit.get("artworkUrl100")
+            it.itunes_url = hit.get("trackViewUrl")
+
     def _attach_preview(self, items: List[TrackRecommendation]) -> None:
+        # 같은 아티스트 곡이 2개 이상이면 아티스트 단위 1회 검색으로 묶어서 조회
+        groups: Dict[str, List[TrackRecommendation]] = {}
         for it in items:
-            try:
-                hit = self.itunes.search_track(it.track, it.artist, country="KR")
+            groups.setdefault(it.artist, []).append(it)
+
+        batch_artists = [a for a, group in groups.items() if len(group) > 1]
+        misses = [it for a, group in groups.items() if len(group) == 1 for it in group]
+
+        for artist, songs in zip(batch_artists, self._pool.map(self._search_artist_songs, batch_artists)):
+            # artistTerm 검색은 "Muse" → "Amuse", "Muse Dash"도 돌려줌 → 아티스트명이 정확히 같은 곡만
+            # (collab 표기 등으로 안 맞으면 아래에서 misses → 곡 단위 검색)
+            artist_low = normalize_space(artist).casefold()
+            by_title: Dict[str, Dict[str, Any]] = {}
+            for song in songs:
+                title = song.get("trackName")
+                if title and normalize_space(str(song.get("artistName") or "")).casefold() == artist_low:
+                    by_title.setdefault(normalize_title(title), song)
+
+            for it in groups[artist]:
+                hit = by_title.get(normalize_title(it.track))
                 if hit:
-                    it.preview_url = hit.get("previewUrl")
-                    it.artwork_url = hit.get("artworkUrl100")
-                    it.itunes_url = hit.get("trackViewUrl")
-            except Exception:
-                continue
+                    self._apply_preview(it, hit)
+                else:
+                    misses.append(it)
+
+        # batch에서 못 찾은 곡만 곡 단위 검색 (병렬)
+        for it, hit in zip(misses, self._pool.map(self._search_preview, misses)):
+            self._apply_preview(it, hit)
 
     def _safe_float(self, x) -> Optional[float]:
         try:
             return float(x) if x is not None else None
-        except Exception:
+        except (TypeError, ValueError):
             return None
 
     def _reason(self, base: str, tags: List[str]) -> str:
@@ -108,12 +216,20 @@ class RecommendService:
             return f"{base} | tags: {', '.join(tags[:3])}"
         return base
 
+    def _artist_tags(self, artist: str, limit: int = 5) -> List[str]:
+        try:
+            return self.lastfm.artist_get_toptags(artist, limit=limit)
+        except PROVIDER_ERRORS as e:
+            logger.warning("Last.fm artist tags failed (%s): %s", artist, e)
+            return []
+
     def _get_fallback_tags_for_track(
         self,
         track: str,
         artist: str,
         similar_artist: str,
         query_artist: str,
+        artist_tags: Dict[str, List[str]],
         limit: int = 5,
     ) -> List[str]:
         """
@@ -121,119 +237,162 @@ class RecommendService:
         1) similar artist top tags
         2) query artist top tags
         3) track top tags
+        artist_tags: artist -> top tags, fetched once per artist by the caller.
         """
         # 1) similar artist tags
-        try:
-            tags = self.lastfm.artist_get_toptags(similar_artist, limit=limit)
-            if tags:
-                return tags
-        except Exception:
-            pass
+        tags = artist_tags.get(similar_artist)
+        if tags:
+            return tags[:limit]
 
         # 2) original/query artist tags
-        try:
-            tags = self.lastfm.artist_get_toptags(query_artist, limit=limit)
-            if tags:
-                return tags
-        except Exception:
-            pass
+        tags = artist_tags.get(query_artist)
+        if tags:
+            return tags[:limit]
 
         # 3) track tags
         try:
             tags = self.lastfm.track_get_toptags(track, artist, limit=limit)
             if tags:
                 return tags
-        except Exception:
-            pass
+        except PROVIDER_ERRORS as e:
+            logger.warning("Last.fm track tags failed (%s - %s): %s", track, artist, e)
 
         return []
 
-    def _recommend_by_track(self, track: str, artist: str, limit_tracks: int) -> List[TrackRecommendation]:
-        raws = self.lastfm.track_get_similar(track, artist, limit=limit_tracks)
-        items: List[TrackRecommendation] = []
+    def _track_tags(self, track: str, artist: str) -> List[str]:
+        try:
+            return self.lastfm.track_get_toptags(track, artist, limit=5)
+        except PROVIDER_ERRORS as e:
+            logger.warning("Last.fm track tags failed (%s - %s): %s", track, artist, e)
+            return []
 
+    def _recommend_by_track(
+        self,
+        track: str,
+        artist: str,
+        limit_tracks: int,
+        raws: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[TrackRecommendation]:
+        # raws: 이미 받아둔 track.getSimilar 결과 (speculative fetch)
+        if raws is None:
+            raws = self.lastfm.track_get_similar(track, artist, limit=limit_tracks)
+
+        rows = []
         for idx, r in enumerate(raws, start=1):
-            name = (r or {}).get("name")
-            art = ((r or {}).get("artist") or {}).get("name")
-            url = (r or {}).get("url")
-            sim = self._safe_float((r or {}).get("match"))
+            name = dig(r, "name")
+            art = dig(r, "artist", "name")
+            url = dig(r, "url")
+            sim = self._safe_float(dig(r, "match"))
 
-            if not name or not art:
+            # JSON 문자열은 이미 str → str() 복사 대신 타입만 한 번 확인
+            if not isinstance(name, str) or not isinstance(art, str) or not name or not art:
                 continue
+            # 같은 아티스트가 여러 유사곡에 반복 등장 → intern으로 문자열 객체 공유
+            rows.append((idx, name, sys.intern(art), url, sim))
 
-            try:
-                tags = self.lastfm.track_get_toptags(name, art, limit=5)
-            except Exception:
-                tags = []
+        # track tag(Last.fm)와 preview(iTunes)는 서로 독립적 → 동시에 진행
+        tag_futures = [self._pool.submit(self._track_tags, name, art) for _, name, art, _, _ in rows]
 
+        items: List[TrackRecommendation] = []
+        for idx, name, art, url, sim in rows:
             items.append(TrackRecommendation(
-                track=str(name),
-                artist=str(art),
+                track=name,
+                artist=art,
                 rank=idx,
                 similarity=sim,
                 lastfm_url=url,
-                tags=tags,
-                reason=self._reason("Similar track based on Last.fm similarity", tags),
             ))
 
         self._attach_preview(items)
+
+        for it, fut in zip(items, tag_futures):
+            it.tags = fut.result()
+            it.reason = self._reason("Similar track based on Last.fm similarity", it.tags)
         return items
 
     def _recommend_by_artist_fallback(self, artist: str, limit_tracks: int) -> List[TrackRecommendation]:
         sim_artists = self.lastfm.artist_get_similar(artist, limit=10)
 
-        items: List[TrackRecommendation] = []
-        rank = 1
-
+        named = []
         for a in sim_artists:
-            a_name = (a or {}).get("name")
-            if not a_name:
+            a_name = dig(a, "name")
+            if not isinstance(a_name, str) or not a_name:
                 continue
+            named.append((sys.intern(a_name), self._safe_float(dig(a, "match"))))
 
-            a_match = self._safe_float((a or {}).get("match"))
+        # 유사 아티스트별 top tracks 조회 병렬 실행
+        top_lists = self._pool.map(lambda na: self.lastfm.artist_get_top_tracks(na[0], limit=3), named)
 
-            top_tracks = self.lastfm.artist_get_top_tracks(a_name, limit=3)
+        rows = []
+        seen = set()
+        for (a_name, a_match), top_tracks in zip(named, top_lists):
             for t in top_tracks:
-                t_name = (t or {}).get("name")
-                t_artist = ((t or {}).get("artist") or {}).get("name") or a_name
-                url = (t or {}).get("url")
+                t_name = dig(t, "name")
+                t_artist = dig(t, "artist", "name") or a_name
+                url = dig(t, "url")
 
-                if not t_name:
+                if not isinstance(t_name, str) or not t_name or not isinstance(t_artist, str):
                     continue
+                t_artist = sys.intern(t_artist)
 
-                # ✅ robust tags for fallback
-                tags = self._get_fallback_tags_for_track(
-                    track=str(t_name),
-                    artist=str(t_artist),
-                    similar_artist=str(a_name),
-                    query_artist=str(artist),
-                    limit=5,
-                )
+                # 서로 다른 유사 아티스트에서 같은 곡이 나오면 중복 조회/표시 skip
+                key = (t_name.casefold(), t_artist.casefold())
+                if key in seen:
+                    continue
+                seen.add(key)
 
-                items.append(TrackRecommendation(
-                    track=str(t_name),
-                    artist=str(t_artist),
-                    rank=rank,
-                    similarity=a_match,
-                    lastfm_url=url,
-                    tags=tags,
-                    reason=self._reason(f"Top track from similar artist: {a_name}", tags),
-                ))
-
-                rank += 1
-                if len(items) >= limit_tracks:
+                rows.append((t_name, t_artist, a_name, a_match, url))
+                if len(rows) >= limit_tracks:
                     break
 
-            if len(items) >= limit_tracks:
+            if len(rows) >= limit_tracks:
                 break
 
+        items: List[TrackRecommendation] = []
+        for rank, (t_name, t_artist, a_name, a_match, url) in enumerate(rows, start=1):
+            items.append(TrackRecommendation(
+                track=t_name,
+                artist=t_artist,
+                rank=rank,
+                similarity=a_match,
+                lastfm_url=url,
+            ))
+
+        # artist top tags는 곡이 아니라 아티스트 단위로 한 번씩만 조회 (preview 조회와 동시에 진행)
+        tag_artists = list(dict.fromkeys(row[2] for row in rows))
+        tag_futures = [self._pool.submit(self._artist_tags, a) for a in tag_artists]
+
         self._attach_preview(items)
+
+        artist_tags = {a: fut.result() for a, fut in zip(tag_artists, tag_futures)}
+        # query artist tags는 tag가 빈 유사 아티스트가 있을 때만 → 평소엔 Last.fm 호출 1회 절약
+        if artist not in artist_tags and not all(artist_tags.values()):
+            artist_tags[artist] = self._artist_tags(artist)
+
+        # ✅ robust tags for fallback (track tags는 두 artist 조회가 모두 비었을 때만)
+        tags_list = self._pool.map(
+            lambda row: self._get_fallback_tags_for_track(
+                track=row[0],
+                artist=row[1],
+                similar_artist=row[2],
+                query_artist=artist,
+                artist_tags=artist_tags,
+                limit=5,
+            ),
+            rows,
+        )
+
+        for it, row, tags in zip(items, rows, tags_list):
+            it.tags = tags
+            it.reason = self._reason(f"Top track from similar artist: {row[2]}", tags)
         return items
 
     def _sort_items(self, items: List[TrackRecommendation]) -> None:
-        def key(x: TrackRecommendation):
-            return (
-                1 if x.preview_url else 0,
-                x.similarity if isinstance(x.similarity, float) else -1,
-            )
-        items.sort(key=key, reverse=True)
+        # key를 한 번에 tuple로 만들어 두고 C 레벨 tuple 비교로 정렬
+        # (-i: reverse 정렬에서도 동점이면 기존 순서 유지)
+        decorated = [
+            (1 if it.preview_url else 0, it.similarity if isinstance(it.similarity, float) else -1.0, -i)
+            for i, it in enumerate(items)
+        ]
+        decorated.sort(reverse=True)
+        items[:] = [items[-neg_i] for _, _, neg_i in decorated]
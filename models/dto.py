@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackRecommendation:
     track: str
     artist: str
@@ -18,7 +18,7 @@ class TrackRecommendation:
     tags: List[str] = field(default_factory=list)
     reason: str = ""  
 
-@dataclass
+@dataclass(slots=True)
 class RecommendResult:
     mode: str  # "track" or "artist_fallback"
     resolved_track: Optional[str] = None
@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.favorites import FavoritesStore
+
+
+class ReloadIfChangedTest(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "favorites.json")
+        self.store = FavoritesStore(self.path)
+        self.store.upsert({"track": "Creep", "artist": "Radiohead"})
+        self.store.flush(compact=True)
+
+    def _edit_externally(self, items):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "items": items}, f)
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_external_edit_survives_pending_clear(self):
+        self.store.clear()
+        self._edit_externally([{"track": "Yellow", "artist": "Coldplay"}])
+
+        self.assertTrue(self.store.reload_if_changed())
+        self.assertEqual([it["track"] for it in self.store.load()], ["Yellow"])
+        self.assertEqual([it["track"] for it in FavoritesStore(self.path).load()], ["Yellow"])
+
+    def test_pending_ops_are_replayed_on_top_of_external_edit(self):
+        self.store.upsert({"track": "Karma Police", "artist": "Radiohead"})
+        self._edit_externally([{"track": "Yellow", "artist": "Coldplay"}])
+
+        self.assertTrue(self.store.reload_if_changed())
+        expected = ["Yellow", "Karma Police"]
+        self.assertEqual([it["track"] for it in self.store.load()], expected)
+        self.assertEqual([it["track"] for it in FavoritesStore(self.path).load()], expected)
+
+    def test_unchanged_file_is_not_reloaded(self):
+        self.assertFalse(self.store.reload_if_changed())
+
+
+if __name__ == "__main__":
+    unittest.main()
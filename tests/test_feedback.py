@@ -0,0 +1,32 @@
+import json
+import os
+import tempfile
+import unittest
+
+from utils.feedback import FeedbackStore
+
+
+class LegacyKeyMigrationTest(unittest.TestCase):
+    def _store(self, data):
+        path = os.path.join(tempfile.mkdtemp(), "feedback.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        return FeedbackStore(path)
+
+    def test_case_variants_merge_counts_and_keep_newest_last(self):
+        store = self._store({
+            "Creep|Radiohead": {"like": 2, "dislike": 0, "last": "like", "ts": "2026-01-01T10:00:00"},
+            "creep|radiohead": {"like": 0, "dislike": 1, "last": "dislike", "ts": "2026-02-01T10:00:00"},
+        })
+        self.assertEqual(store.get_counts("Creep", "Radiohead"), (2, 1, "dislike"))
+
+    def test_newest_last_wins_regardless_of_key_order(self):
+        store = self._store({
+            "creep|radiohead": {"like": 0, "dislike": 1, "last": "dislike", "ts": "2026-02-01T10:00:00"},
+            "Creep|Radiohead": {"like": 2, "dislike": 0, "last": "like", "ts": "2026-01-01T10:00:00"},
+        })
+        self.assertEqual(store.get_counts("creep", "radiohead"), (2, 1, "dislike"))
+
+
+if __name__ == "__main__":
+    unittest.main()
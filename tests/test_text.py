@@ -0,0 +1,31 @@
+import unittest
+
+from utils.text import normalize_title
+
+
+class NormalizeTitleTest(unittest.TestCase):
+    def test_drops_trailing_edition_suffixes(self):
+        self.assertEqual(normalize_title("Hey Jude (Remastered 2015)"), "hey jude")
+        self.assertEqual(normalize_title("Song (feat. X) [Radio Edit] "), "song")
+
+    def test_keeps_mid_title_brackets(self):
+        self.assertEqual(normalize_title("Love (Is) Blind"), "love (is) blind")
+        self.assertNotEqual(normalize_title("Love (Is) Blind"), normalize_title("Love Blind"))
+
+    def test_keeps_with_parentheticals(self):
+        self.assertEqual(normalize_title("Dance (With You)"), "dance (with you)")
+        self.assertEqual(normalize_title("Yesterday (With Strings)"), "yesterday (with strings)")
+
+    def test_drops_trailing_dash_edition_suffixes(self):
+        self.assertEqual(normalize_title("Hey Jude - Remastered 2015"), "hey jude")
+        self.assertEqual(normalize_title("Song - Radio Edit"), "song")
+        self.assertEqual(normalize_title("Song – Single Version"), "song")
+        self.assertNotEqual(normalize_title("Song - Live"), normalize_title("Song"))
+
+    def test_live_cut_differs_from_studio_version(self):
+        self.assertNotEqual(normalize_title("Creep (Live)"), normalize_title("Creep"))
+        self.assertNotEqual(normalize_title("Creep [Acoustic Version]"), normalize_title("Creep"))
+
+
+if __name__ == "__main__":
+    unittest.main()
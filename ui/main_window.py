@@ -1,42 +1,128 @@
 from __future__ import annotations
 import os
 import csv
+import time
 from datetime import datetime
+from functools import lru_cache
+from html import escape
 
-from PySide6.QtCore import Qt, QObject, Signal, Slot, QThread, QUrl
-from PySide6.QtGui import QAction, QDesktopServices
+from PySide6.QtCore import Qt, QObject, Signal, Slot, QRunnable, QThreadPool, QTimer, QUrl
+from PySide6.QtGui import QAction, QDesktopServices, QTextDocument, QPalette, QColor, QImage
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QLabel, QComboBox,
-    QTableWidget, QTableWidgetItem, QMessageBox, QTextBrowser,
+    QTableView, QHeaderView, QMessageBox, QTextBrowser,
     QSlider, QSplitter, QFileDialog, QListWidget, QListWidgetItem, QCheckBox
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from PySide6.QtWidgets import QAbstractItemView
 
 from core.recommend_service import RecommendService
 from models.dto import RecommendResult, TrackRecommendation
-from utils.favorites import FavoritesStore, normalize_key
+from utils.favorites import FavoritesStore
+from utils.keys import normalize_key
 from utils.history import SearchHistoryStore
 from utils.feedback import FeedbackStore
-
-
-class RecommendWorker(QObject):
-    finished = Signal(RecommendResult)
-    error = Signal(str)
-
-    def __init__(self, service: RecommendService, text: str):
+from ui.track_table import TrackTableModel, ButtonDelegate
+
+
+# 상세 패널 HTML: 모듈 상수 템플릿 + format_map (필드는 호출 측에서 escape)
+_DETAIL_TMPL = """
+{cover}
+<h3>{track}</h3>
+<p><b>Artist:</b> {artist}</p>
+<p><b>Reason:</b> {reason}</p>
+<p><b>Tags:</b> {tags}</p>
+<p><b>Links:</b> {lastfm} | {itunes}</p>
+<p><b>Preview:</b> {preview}</p>
+<hr/>
+<p><b>Feedback:</b> 👍 {like} / 👎 {dislike} (last: {last})</p>
+<p style="color:gray;">선택 후 아래 👍/👎로 반영할 수 있어요.</p>
+"""
+_COVER_TMPL = '<p><img src="{}" width="160" height="160"/></p>'
+_LINK_TMPL = '<a href="{}">{}</a>'
+
+_CSV_HEADER = ("rank", "track", "artist", "similarity", "preview_url", "lastfm_url", "itunes_url", "tags", "reason")
+
+
+@lru_cache(maxsize=256)
+def _render_detail_html(
+    track: str,
+    artist: str,
+    reason: str,
+    tags: tuple[str, ...],
+    lastfm_url: str | None,
+    itunes_url: str | None,
+    preview_url: str | None,
+    artwork_url: str | None,
+    like_cnt: int,
+    dislike_cnt: int,
+    last: str | None,
+) -> str:
+    """Detail pane HTML; cached so repeated results across searches skip escaping/formatting."""
+    return _DETAIL_TMPL.format_map({
+        "cover": _COVER_TMPL.format(escape(artwork_url)) if artwork_url else "",
+        "track": escape(track),
+        "artist": escape(artist),
+        "reason": escape(reason) if reason else "-",
+        "tags": escape(", ".join(tags)) if tags else "-",
+        "lastfm": _LINK_TMPL.format(escape(lastfm_url), "Last.fm") if lastfm_url else "-",
+        "itunes": _LINK_TMPL.format(escape(itunes_url), "iTunes") if itunes_url else "-",
+        "preview": escape(preview_url) if preview_url else "-",
+        "like": like_cnt,
+        "dislike": dislike_cnt,
+        "last": last or "-",
+    })
+
+
+class RecommendRunnable(QRunnable):
+    """
+    Runs RecommendService.recommend on QThreadPool.globalInstance().
+    Results carry the search token so stale searches can be ignored.
+    """
+
+    class Signals(QObject):
+        # QRunnable is not a QObject, so signals live on a separate QObject.
+        finished = Signal(int, RecommendResult)
+        error = Signal(int, str)
+
+    def __init__(self, service: RecommendService, text: str, token: int):
         super().__init__()
         self.service = service
         self.text = text
+        self.token = token
+        self.signals = RecommendRunnable.Signals()
 
     @Slot()
     def run(self):
         try:
             res = self.service.recommend(self.text, limit_tracks=20)
-            self.finished.emit(res)
+            self.signals.finished.emit(self.token, res)
+        except Exception as e:
+            self.signals.error.emit(self.token, str(e))
+
+
+class ServiceInitRunnable(QRunnable):
+    """
+    Builds RecommendService off the UI thread so the first frame is not
+    blocked by client/cache setup.
+    """
+
+    class Signals(QObject):
+        ready = Signal(object)
+        error = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.signals = ServiceInitRunnable.Signals()
+
+    @Slot()
+    def run(self):
+        try:
+            self.signals.ready.emit(RecommendService())
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -45,12 +131,30 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Music Rec App (PySide6)")
         self.resize(1340, 760)
 
-        self.service = RecommendService()
+        # 백그라운드에서 생성 (_start_service_init) → 준비 전까지 검색 비활성
+        self.service: RecommendService | None = None
+        self._init_runnable: ServiceInitRunnable | None = None
 
         # Data
         self._items: list[TrackRecommendation] = []
         self._result: RecommendResult | None = None
         self._all_items_cache: list[TrackRecommendation] = []
+        # 검색마다 증가; 최신 token이 아닌 결과는 무시 (stale search 취소)
+        self._inflight_token = 0
+        # 검색은 한 번에 하나만 → 진행 중 재요청(Enter/히스토리 클릭)은 네트워크 호출을 쌓지 않고 무시
+        self._search_inflight = False
+        # signals QObject가 GC되지 않도록 실행 중인 runnable 참조 유지
+        self._runnables: dict[int, RecommendRunnable] = {}
+        # id(item) -> 상세 HTML (결과 도착 시 한 번 렌더링)
+        self._detail_html: dict[int, str] = {}
+        # id(item) -> 파싱된 QTextDocument (재선택 시 setHtml 재파싱 없이 setDocument)
+        self._detail_docs: dict[int, QTextDocument] = {}
+        # id(item) -> preview QUrl (클릭마다 URL 재파싱하지 않도록)
+        self._preview_urls: dict[int, QUrl] = {}
+        # id(item) -> _item_features (DTO는 slots라 속성 추가 불가 → side dict)
+        self._rerank_features: dict[int, tuple[float, str, frozenset[str], str]] = {}
+        # artwork_url -> 내려받은 cover (QTextBrowser는 http <img>를 직접 못 불러옴 → addResource)
+        self._artwork: dict[str, QImage] = {}
 
         # Paths
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -58,7 +162,8 @@ class MainWindow(QMainWindow):
 
         # Favorites
         self.favs = FavoritesStore(os.path.join(data_dir, "favorites.json"))
-        self._fav_map = self.favs.to_map()
+        # 결과가 나오기 전엔 쓰이지 않음 → 첫 검색(on_search_clicked)에서 로드
+        self._fav_map: dict[str, dict] = {}
 
         # History
         self.history = SearchHistoryStore(os.path.join(data_dir, "history.json"), max_items=50)
@@ -68,7 +173,14 @@ class MainWindow(QMainWindow):
 
         self._setup_ui()
         self._setup_player()
-        self._refresh_history_ui()
+        # history.json 읽기는 첫 paint 이후로 미룸
+        QTimer.singleShot(0, self._refresh_history_ui)
+        self._start_service_init()
+
+    def closeEvent(self, event):
+        # debounce 중인 즐겨찾기 변경을 기록하고 favorites.log를 favorites.json으로 합침
+        self.favs.flush(compact=True)
+        super().closeEvent(event)
 
     # =========================
     # UI
@@ -93,7 +205,10 @@ class MainWindow(QMainWindow):
         outer.addLayout(top)
 
         self.status = QLabel("Ready")
-        self.status.setStyleSheet("color: gray;")
+        # 고정 색상 → stylesheet(CSS 파싱/스타일 재계산) 대신 palette
+        pal = self.status.palette()
+        pal.setColor(QPalette.WindowText, QColor("gray"))
+        self.status.setPalette(pal)
         outer.addWidget(self.status)
 
         # Main splitter: left sidebar | table | detail
@@ -132,13 +247,22 @@ class MainWindow(QMainWindow):
 
         main_split.addWidget(sidebar)
 
-        # Table
-        self.table = QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels(["#", "Track", "Artist", "Similarity", "Preview", "❤️", "Reason"])
+        # Table (model/view: 셀마다 item/위젯을 만들지 않음)
+        self.table = QTableView()
+        self.model = TrackTableModel(self._is_favorite, self)
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(TrackTableModel.COL_PREVIEW, ButtonDelegate(self.play_row, self.table))
+        self.table.setItemDelegateForColumn(TrackTableModel.COL_FAV, ButtonDelegate(self.toggle_favorite, self.table))
         self.table.verticalHeader().setVisible(False)
+        # resizeRowsToContents 대신 고정 행 높이
+        self.table.verticalHeader().setDefaultSectionSize(28)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # Reason은 한 줄로 자르고 전체 문구는 tooltip으로
+        self.table.setWordWrap(False)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
+        self.table.setSortingEnabled(False)
 
         self.table.setColumnWidth(0, 40)
         self.table.setColumnWidth(1, 320)
@@ -147,13 +271,21 @@ class MainWindow(QMainWindow):
         self.table.setColumnWidth(4, 90)
         self.table.setColumnWidth(5, 70)
         self.table.setColumnWidth(6, 420)
+        # 고정 폭 → 행이 바뀔 때마다 셀 텍스트를 측정해 섹션 크기를 다시 계산하지 않음
+        hdr = self.table.horizontalHeader()
+        hdr.setSectionResizeMode(QHeaderView.Fixed)
+        hdr.setStretchLastSection(False)
 
         main_split.addWidget(self.table)
 
         # Detail
         self.detail = QTextBrowser()
         self.detail.setOpenExternalLinks(True)
-        self.detail.setHtml("<b>결과를 선택하면 상세가 표시됩니다.</b>")
+        # 안내 문구 전용 문서; QTextBrowser는 교체되는 자식 문서를 삭제하므로 parent는 window
+        self._detail_msg_doc = QTextDocument(self)
+        self._detail_msg_doc.setDefaultFont(self.detail.font())
+        self.detail.setDocument(self._detail_msg_doc)
+        self._set_detail_message("<b>결과를 선택하면 상세가 표시됩니다.</b>")
         main_split.addWidget(self.detail)
 
         main_split.setSizes([240, 800, 320])
@@ -197,10 +329,11 @@ class MainWindow(QMainWindow):
 
         # Signals
         self.btn_search.clicked.connect(self.on_search_clicked)
-        self.table.itemSelectionChanged.connect(self.on_row_selected)
+        self.table.selectionModel().selectionChanged.connect(self.on_row_selected)
 
         self.btn_play_pause.clicked.connect(self.on_play_pause)
         self.slider_vol.valueChanged.connect(self.on_volume_changed)
+        self.slider_pos.sliderPressed.connect(self.on_seek_pressed)
         self.slider_pos.sliderReleased.connect(self.on_seek_released)
 
         self.btn_open_lastfm.clicked.connect(self.on_open_lastfm)
@@ -213,6 +346,10 @@ class MainWindow(QMainWindow):
 
         # Sidebar signals
         self.list_history.itemClicked.connect(self.on_history_item_clicked)
+        self._history_search_timer = QTimer(self)
+        self._history_search_timer.setSingleShot(True)
+        self._history_search_timer.setInterval(250)
+        self._history_search_timer.timeout.connect(self.on_search_clicked)
         self.btn_clear_history.clicked.connect(self.on_clear_history)
         self.chk_favs_only.stateChanged.connect(self.on_toggle_favs_only)
         self.btn_show_favs_file.clicked.connect(self.open_favorites_file)
@@ -240,10 +377,14 @@ class MainWindow(QMainWindow):
         act_clear_feedback = QAction("Clear feedback", self)
         act_clear_feedback.triggered.connect(self.clear_feedback)
 
+        act_rerank = QAction("Re-rank", self)
+        act_rerank.triggered.connect(self._rerank_after_feedback)
+
         self.menuBar().addAction(act_export_csv)
         self.menuBar().addAction(act_export_txt)
         self.menuBar().addAction(act_open_feedback)
         self.menuBar().addAction(act_clear_feedback)
+        self.menuBar().addAction(act_rerank)
         self.menuBar().addAction(act_quit)
 
     # =========================
@@ -261,6 +402,14 @@ class MainWindow(QMainWindow):
         self.player.playbackStateChanged.connect(self.on_state_changed)
 
         self._duration = 0
+        # positionChanged(30~60Hz) → slider 갱신은 ~4Hz, 값이 바뀔 때만
+        self._last_pos_update = 0.0
+        self._last_slider_val = -1
+        # 사용자가 slider를 드래그하는 동안에는 position 갱신을 건너뜀
+        self._seeking = False
+
+        # preview 앞부분 prefetch용 → Play 시 DNS/TLS/커넥션이 이미 warm
+        self._nam = QNetworkAccessManager(self)
 
     # =========================
     # History UI
@@ -283,7 +432,8 @@ class MainWindow(QMainWindow):
         if not q:
             return
         self.input.setText(q)
-        self.on_search_clicked()
+        # 연속 클릭/키 반복은 마지막 것만 검색 (250ms debounce)
+        self._history_search_timer.start()
 
     @Slot()
     def on_clear_history(self):
@@ -294,50 +444,75 @@ class MainWindow(QMainWindow):
         self._refresh_history_ui()
 
     # =========================
-    # Search flow (QThread)
+    # Search flow (QThreadPool)
     # =========================
+    def _start_service_init(self):
+        self.btn_search.setEnabled(False)
+        self.status.setText("Initializing...")
+        runnable = ServiceInitRunnable()
+        runnable.signals.ready.connect(self.on_service_ready)
+        runnable.signals.error.connect(self.on_service_error)
+        self._init_runnable = runnable
+        QThreadPool.globalInstance().start(runnable)
+
+    @Slot(object)
+    def on_service_ready(self, service: RecommendService):
+        self._init_runnable = None
+        self.service = service
+        self.btn_search.setEnabled(True)
+        self.status.setText("Ready")
+
+    @Slot(str)
+    def on_service_error(self, msg: str):
+        self._init_runnable = None
+        self.status.setText("Error")
+        QMessageBox.critical(self, "Error", f"추천 서비스 초기화 실패:\n{msg}")
+
     @Slot()
     def on_search_clicked(self):
+        if self.service is None or self._search_inflight:
+            return
         text = self.input.text().strip()
         if not text:
             QMessageBox.information(self, "Info", "입력값을 넣어주세요.")
             return
 
-        # Persist history
-        self.history.add(text)
-        self._refresh_history_ui()
+        # Persist history (변화 없으면 목록도 다시 안 그림)
+        if self.history.add(text):
+            self._refresh_history_ui()
 
-        # refresh favorites cache
-        self._fav_map = self.favs.to_map()
+        # refresh favorites cache: favorites.json을 외부에서 고친 경우(mtime/size 변화)에만 다시 읽음
+        if self.favs.reload_if_changed() or not self._fav_map:
+            self._fav_map = self.favs.to_map()
 
         # UI lock
         self.btn_search.setEnabled(False)
         self.status.setText("검색/추천 중... (네트워크)")
-        self.table.setRowCount(0)
-        self.detail.setHtml("<i>Loading...</i>")
+        self._fill_table([])
+        self._set_detail_message("<i>Loading...</i>")
         self._items = []
         self._all_items_cache = []
+        self._detail_html = {}
+        self._clear_detail_docs()
+        self._preview_urls = {}
+        self._artwork = {}
+        self._rerank_features = {}
         self._result = None
 
-        self.thread = QThread()
-        self.worker = RecommendWorker(self.service, text)
-        self.worker.moveToThread(self.thread)
-
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.on_recommend_finished)
-        self.worker.error.connect(self.on_recommend_error)
-
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-
-        self.worker.error.connect(self.thread.quit)
-        self.worker.error.connect(self.worker.deleteLater)
-
-        self.thread.start()
-
-    @Slot(RecommendResult)
-    def on_recommend_finished(self, res: RecommendResult):
+        self._search_inflight = True
+        self._inflight_token += 1
+        runnable = RecommendRunnable(self.service, text, self._inflight_token)
+        runnable.signals.finished.connect(self.on_recommend_finished)
+        runnable.signals.error.connect(self.on_recommend_error)
+        self._runnables[runnable.token] = runnable
+        QThreadPool.globalInstance().start(runnable)
+
+    @Slot(int, RecommendResult)
+    def on_recommend_finished(self, token: int, res: RecommendResult):
+        self._runnables.pop(token, None)
+        if token != self._inflight_token:
+            return
+        self._search_inflight = False
         self.btn_search.setEnabled(True)
         self.status.setText(res.message or "Done")
 
@@ -351,6 +526,10 @@ class MainWindow(QMainWindow):
 
         self._all_items_cache = items[:]
         self._items = items
+        self._detail_html = {id(it): self._render_detail(it) for it in self._all_items_cache}
+        self._preview_urls = {id(it): QUrl(it.preview_url) for it in self._all_items_cache if it.preview_url}
+        self._prefetch_previews()
+        self._fetch_artwork()
 
         if self.chk_favs_only.isChecked():
             self._items = [x for x in self._all_items_cache if self._is_favorite(x)]
@@ -360,12 +539,71 @@ class MainWindow(QMainWindow):
         self._fill_table(self._items)
 
         if not self._items:
-            self.detail.setHtml("<b>추천 결과가 없습니다.</b><br/>입력을 조금 더 구체적으로 해보세요.")
+            self._set_detail_message("<b>추천 결과가 없습니다.</b><br/>입력을 조금 더 구체적으로 해보세요.")
         else:
-            self.detail.setHtml("<b>왼쪽에서 곡을 선택하면 상세/미리듣기가 가능합니다.</b>")
+            self._set_detail_message("<b>왼쪽에서 곡을 선택하면 상세/미리듣기가 가능합니다.</b>")
+
+    def _prefetch_previews(self):
+        # 같은 요청의 HTTP status로 죽은 링크(404 등)도 확인 → 별도 HEAD 요청 없음
+        token = self._inflight_token
+        for key, url in self._preview_urls.items():
+            req = QNetworkRequest(url)
+            req.setRawHeader(b"Range", b"bytes=0-65535")
+            reply = self._nam.get(req)
+            reply.finished.connect(lambda r=reply, k=key: self._on_preview_probed(r, k, token))
+
+    def _on_preview_probed(self, reply: QNetworkReply, key: int, token: int):
+        reply.deleteLater()
+        if token != self._inflight_token:
+            return
+        status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+        # 네트워크 오류(오프라인/timeout)는 판단 보류; 서버가 4xx/5xx를 준 경우만 비활성
+        if status is None or int(status) < 400:
+            return
 
-    @Slot(str)
-    def on_recommend_error(self, msg: str):
+        it = next((x for x in self._all_items_cache if id(x) == key), None)
+        if it is None:
+            return
+        it.preview_url = None
+        self._preview_urls.pop(key, None)
+        self._rerank_features.pop(key, None)
+        self._detail_html.pop(key, None)
+        # 표시 중이면 preview 없는 HTML로 다시 만들어 교체 (선택이 없어도 pane에 남아 있을 수 있음)
+        self._drop_detail_doc(it)
+
+        row = next((i for i, x in enumerate(self._items) if x is it), None)
+        if row is not None:
+            self.model.refresh_cell(row, TrackTableModel.COL_PREVIEW)
+        if self._current_item() is it:
+            self._set_link_buttons(it)
+
+    def _fetch_artwork(self):
+        token = self._inflight_token
+        for url in {it.artwork_url for it in self._all_items_cache if it.artwork_url}:
+            reply = self._nam.get(QNetworkRequest(QUrl(url)))
+            reply.finished.connect(lambda r=reply, u=url: self._on_artwork_fetched(r, u, token))
+
+    def _on_artwork_fetched(self, reply: QNetworkReply, url: str, token: int):
+        reply.deleteLater()
+        if token != self._inflight_token or reply.error() != QNetworkReply.NoError:
+            return
+        img = QImage.fromData(reply.readAll())
+        if img.isNull():
+            return
+        self._artwork[url] = img
+
+        # 이미 만든 문서는 cover 없이 배치됨 → 버리고 resource 포함해 다시 생성
+        # (표시 중인 문서는 선택 여부와 상관없이 _drop_detail_doc이 바로 교체)
+        for it in self._all_items_cache:
+            if it.artwork_url == url:
+                self._drop_detail_doc(it)
+
+    @Slot(int, str)
+    def on_recommend_error(self, token: int, msg: str):
+        self._runnables.pop(token, None)
+        if token != self._inflight_token:
+            return
+        self._search_inflight = False
         self.btn_search.setEnabled(True)
         self.status.setText("Error")
         QMessageBox.critical(self, "Error", msg)
@@ -374,30 +612,28 @@ class MainWindow(QMainWindow):
     # Table
     # =========================
     def _fill_table(self, items: list[TrackRecommendation]):
-        self.table.setRowCount(len(items))
-
-        for row, it in enumerate(items):
-            self.table.setItem(row, 0, QTableWidgetItem(str(it.rank)))
-            self.table.setItem(row, 1, QTableWidgetItem(it.track))
-            self.table.setItem(row, 2, QTableWidgetItem(it.artist))
-
-            sim_txt = f"{it.similarity:.2f}" if isinstance(it.similarity, float) else "-"
-            self.table.setItem(row, 3, QTableWidgetItem(sim_txt))
-
-            btn_preview = QPushButton("Play" if it.preview_url else "N/A")
-            btn_preview.setEnabled(bool(it.preview_url))
-            btn_preview.clicked.connect(lambda checked=False, r=row: self.play_row(r))
-            self.table.setCellWidget(row, 4, btn_preview)
-
-            fav_btn = QPushButton("♥" if self._is_favorite(it) else "♡")
-            fav_btn.setToolTip("즐겨찾기 추가/해제")
-            fav_btn.clicked.connect(lambda checked=False, r=row: self.toggle_favorite(r))
-            self.table.setCellWidget(row, 5, fav_btn)
+        # rerank/필터(같은 item의 재정렬·부분집합) → layoutChanged로 selection 유지, reset 없음
+        if items and self.model.contains_all(items):
+            self.model.reorder(items)
+            self.on_row_selected()
+            return
 
-            reason = getattr(it, "reason", "") or ""
-            self.table.setItem(row, 6, QTableWidgetItem(reason))
+        # 새 결과: model reset은 selection을 지움 → 같은 곡이 있으면 다시 선택
+        sel = self._selected_row()
+        prev = self.model.item(sel) if sel is not None else None
 
-        self.table.resizeRowsToContents()
+        # reset + 재선택 동안 repaint 한 번으로 묶음
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.model.set_items(items)
+            row = next((i for i, x in enumerate(items) if x is prev), None) if prev is not None else None
+            if row is not None:
+                self.table.selectRow(row)
+            else:
+                # model reset은 selectionChanged를 보내지 않음 → 버튼 상태 직접 동기화
+                self.on_row_selected()
+        finally:
+            self.table.setUpdatesEnabled(True)
 
     # =========================
     # Selection & detail
@@ -413,33 +649,60 @@ class MainWindow(QMainWindow):
         self._show_detail(it)
         self._set_link_buttons(it)
 
-    def _show_detail(self, it: TrackRecommendation):
-        tags = ", ".join(it.tags) if it.tags else "-"
-        lastfm = f'<a href="{it.lastfm_url}">Last.fm</a>' if it.lastfm_url else "-"
-        itunes = f'<a href="{it.itunes_url}">iTunes</a>' if it.itunes_url else "-"
-        preview = it.preview_url or "-"
-        reason = getattr(it, "reason", "") or "-"
-
-        like_cnt, dislike_cnt, last = self.feedback.get_counts(it.track, it.artist)
-        last_txt = last if last else "-"
-
-        cover_html = ""
-        if getattr(it, "artwork_url", None):
-            cover_html = f'<p><img src="{it.artwork_url}" width="160" height="160"/></p>'
-
-        html = f"""
-        {cover_html}
-        <h3>{it.track}</h3>
-        <p><b>Artist:</b> {it.artist}</p>
-        <p><b>Reason:</b> {reason}</p>
-        <p><b>Tags:</b> {tags}</p>
-        <p><b>Links:</b> {lastfm} | {itunes}</p>
-        <p><b>Preview:</b> {preview}</p>
-        <hr/>
-        <p><b>Feedback:</b> 👍 {like_cnt} / 👎 {dislike_cnt} (last: {last_txt})</p>
-        <p style="color:gray;">선택 후 아래 👍/👎로 반영할 수 있어요.</p>
+    def _show_detail(self, it: TrackRecommendation, refresh: bool = False):
+        # 결과 도착 시 미리 만든 HTML 사용; 피드백 변경 시에만 refresh
+        key = id(it)
+        doc = None if refresh else self._detail_docs.get(key)
+        old = None
+        if doc is None:
+            html = None if refresh else self._detail_html.get(key)
+            if html is None:
+                html = self._render_detail(it)
+                self._detail_html[key] = html
+            # HTML 파싱은 item당 한 번 → 이후 선택은 문서만 교체
+            doc = QTextDocument(self)
+            doc.setDefaultFont(self.detail.font())
+            img = self._artwork.get(it.artwork_url) if it.artwork_url else None
+            if img is not None:
+                doc.addResource(QTextDocument.ImageResource, QUrl(it.artwork_url), img)
+            doc.setHtml(html)
+            old = self._detail_docs.get(key)
+            self._detail_docs[key] = doc
+        self.detail.setDocument(doc)
+        if old is not None:
+            old.deleteLater()
+
+    def _drop_detail_doc(self, it: TrackRecommendation) -> None:
         """
-        self.detail.setHtml(html)
+        Discard the cached detail document of it. If the pane still shows that
+        document, a rebuilt one is set first so the view never holds a deleted document.
+        """
+        doc = self._detail_docs.pop(id(it), None)
+        if doc is None:
+            return
+        if self.detail.document() is doc:
+            self._show_detail(it)
+        doc.deleteLater()
+
+    def _set_detail_message(self, html: str):
+        if self.detail.document() is not self._detail_msg_doc:
+            self.detail.setDocument(self._detail_msg_doc)
+        self._detail_msg_doc.setHtml(html)
+
+    def _clear_detail_docs(self):
+        if self.detail.document() is not self._detail_msg_doc:
+            self.detail.setDocument(self._detail_msg_doc)
+        for doc in self._detail_docs.values():
+            doc.deleteLater()
+        self._detail_docs = {}
+
+    def _render_detail(self, it: TrackRecommendation) -> str:
+        # 피드백 카운트는 인자로 넘김 → 카운트가 바뀌면 자연히 cache miss
+        like_cnt, dislike_cnt, last = self.feedback.get_counts(it.track, it.artist)
+        return _render_detail_html(
+            it.track, it.artist, it.reason, tuple(it.tags), it.lastfm_url, it.itunes_url,
+            it.preview_url, it.artwork_url, like_cnt, dislike_cnt, last,
+        )
 
     def _set_link_buttons(self, it: TrackRecommendation | None):
         if not it:
@@ -491,7 +754,7 @@ class MainWindow(QMainWindow):
     def _refresh_detail_after_feedback(self):
         it = self._current_item()
         if it:
-            self._show_detail(it)
+            self._show_detail(it, refresh=True)
 
     def open_feedback_file(self):
         path = self.feedback.filepath
@@ -504,6 +767,8 @@ class MainWindow(QMainWindow):
         if reply != QMessageBox.StandardButton.Yes:
             return
         self.feedback.clear()
+        self._detail_html.clear()
+        self._clear_detail_docs()
         self.status.setText("피드백 초기화 완료")
         self._rerank_after_feedback()
         self._refresh_detail_after_feedback()
@@ -512,7 +777,8 @@ class MainWindow(QMainWindow):
         if not self._all_items_cache:
             return
 
-        self._all_items_cache = self._personalized_rerank(self._all_items_cache)
+        # 새 리스트를 만들지 않고 제자리 정렬
+        self._personalized_rerank(self._all_items_cache, inplace=True)
 
         if self.chk_favs_only.isChecked():
             self._items = [x for x in self._all_items_cache if self._is_favorite(x)]
@@ -545,24 +811,17 @@ class MainWindow(QMainWindow):
             self.favs.upsert(snap)
             self._fav_map[key] = snap
 
-        w = self.table.cellWidget(row, 5)
-        if isinstance(w, QPushButton):
-            w.setText("♥" if key in self._fav_map else "♡")
-
-        self._all_items_cache = self._personalized_rerank(self._all_items_cache)
-
-        if self.chk_favs_only.isChecked():
-            self._items = [x for x in self._all_items_cache if self._is_favorite(x)]
-        else:
-            self._items = self._all_items_cache[:]
-
-        for i, x in enumerate(self._items, start=1):
-            x.rank = i
+        if not self.chk_favs_only.isChecked():
+            # 하트 한 칸만 다시 그림; 재정렬은 메뉴의 Re-rank로 명시적으로
+            self.model.refresh_cell(row, TrackTableModel.COL_FAV)
+            return
 
-        self._fill_table(self._items)
+        self._rerank_after_feedback()
 
     def open_favorites_file(self):
         path = self.favs.filepath
+        # 열기 전에 log까지 합쳐서 favorites.json 하나로 완전한 상태를 보이게
+        self.favs.flush(compact=True)
         if not os.path.exists(path):
             self.favs.save([])
         QDesktopServices.openUrl(QUrl.fromLocalFile(path))
@@ -591,34 +850,52 @@ class MainWindow(QMainWindow):
     # =========================
     # Personalization / Rerank
     # =========================
-    def _personalized_rerank(self, items: list[TrackRecommendation]) -> list[TrackRecommendation]:
+    @staticmethod
+    def _item_features(it: TrackRecommendation) -> tuple[float, str, frozenset[str], str]:
+        """Favorites-independent part of the rerank score plus normalized artist/tags/key."""
+        base = 0.0
+        if it.preview_url:
+            base += 1000.0
+        if isinstance(it.similarity, float):
+            base += it.similarity * 100.0
+        artist_lc = (it.artist or "").strip().lower()
+        tags_lc = frozenset(t.strip().lower() for t in it.tags if t) if it.tags else frozenset()
+        return base, artist_lc, tags_lc, normalize_key(it.track, it.artist)
+
+    def _personalized_rerank(self, items: list[TrackRecommendation], inplace: bool = False) -> list[TrackRecommendation]:
         if not items:
             return items
 
         fav_artists = self.favs.favorite_artists()
         fav_tags = self.favs.favorite_tags()
 
+        fav_map = self._fav_map
+        feedback_score = self.feedback.score
+        features = self._rerank_features
+
         def score(it: TrackRecommendation) -> float:
-            s = 0.0
-            if it.preview_url:
-                s += 1000.0
-            if isinstance(it.similarity, float):
-                s += it.similarity * 100.0
+            f = features.get(id(it))
+            if f is None:
+                f = features[id(it)] = self._item_features(it)
+            s, artist_lc, tags_lc, key = f
 
             # favorites boosts
-            if (it.artist or "").strip().lower() in fav_artists:
+            if artist_lc in fav_artists:
                 s += 60.0
-            if it.tags and fav_tags:
-                overlap = {t.strip().lower() for t in it.tags if t} & fav_tags
-                s += 10.0 * len(overlap)
-            if self._is_favorite(it):
+            if tags_lc and fav_tags:
+                s += 10.0 * len(tags_lc & fav_tags)
+            if key in fav_map:
                 s += 80.0
 
             # feedback boosts
-            s += float(self.feedback.score(it.track, it.artist))
+            s += float(feedback_score(it.track, it.artist))
 
             return s
 
+        # key=는 item당 한 번만 계산됨 (내부적으로 decorate-sort-undecorate)
+        if inplace:
+            items.sort(key=score, reverse=True)
+            return items
         return sorted(items, key=score, reverse=True)
 
     # =========================
@@ -634,24 +911,26 @@ class MainWindow(QMainWindow):
         if not path:
             return
 
+        def rows():
+            yield _CSV_HEADER
+            for it in items:
+                yield (
+                    it.rank,
+                    it.track,
+                    it.artist,
+                    "" if it.similarity is None else it.similarity,
+                    it.preview_url or "",
+                    it.lastfm_url or "",
+                    it.itunes_url or "",
+                    ";".join(it.tags) if it.tags else "",
+                    it.reason or "",
+                )
+
+        items = self._items
         try:
-            with open(path, "w", newline="", encoding="utf-8-sig") as f:
-                w = csv.writer(f)
-                w.writerow(["rank", "track", "artist", "similarity", "preview_url", "lastfm_url", "itunes_url", "tags", "reason"])
-                for it in self._items:
-                    tags = ";".join(it.tags) if it.tags else ""
-                    reason = getattr(it, "reason", "") or ""
-                    w.writerow([
-                        it.rank,
-                        it.track,
-                        it.artist,
-                        "" if it.similarity is None else it.similarity,
-                        it.preview_url or "",
-                        it.lastfm_url or "",
-                        it.itunes_url or "",
-                        tags,
-                        reason,
-                    ])
+            # 행을 리스트로 모으지 않고 generator로 흘려 쓰기 + 큰 버퍼로 write 호출 최소화
+            with open(path, "w", newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
+                csv.writer(f).writerows(rows())
             self.status.setText(f"CSV 저장 완료: {path}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"CSV 저장 실패: {e}")
@@ -702,9 +981,10 @@ class MainWindow(QMainWindow):
         if row < 0 or row >= len(self._items):
             return
         it = self._items[row]
-        if not it.preview_url:
+        url = self._preview_urls.get(id(it))
+        if url is None:
             return
-        self.player.setSource(QUrl(it.preview_url))
+        self.player.setSource(url)
         self.player.play()
 
     @Slot()
@@ -724,8 +1004,16 @@ class MainWindow(QMainWindow):
     def on_volume_changed(self, v: int):
         self.audio.setVolume(max(0.0, min(1.0, v / 100.0)))
 
+    @Slot()
+    def on_seek_pressed(self):
+        self._seeking = True
+
     @Slot()
     def on_seek_released(self):
+        self._seeking = False
+        # 드래그 후 다음 positionChanged에서 바로 반영되도록 throttle 상태 초기화
+        self._last_slider_val = -1
+        self._last_pos_update = 0.0
         if self._duration <= 0:
             return
         val = self.slider_pos.value() / 1000.0
@@ -734,11 +1022,26 @@ class MainWindow(QMainWindow):
 
     @Slot(int)
     def on_position_changed(self, pos: int):
-        if self._duration <= 0:
+        if self._seeking or self._duration <= 0:
+            return
+        # 최소화/숨김 상태면 그릴 필요 없음 (다시 보이면 다음 tick에 갱신)
+        if self.isMinimized() or not self.isVisible():
+            return
+        # 정수 연산만 사용 (float 나눗셈/캐스트 없음)
+        val = (pos * 1000) // self._duration
+        if val < 0:
+            val = 0
+        elif val > 1000:
+            val = 1000
+        if val == self._last_slider_val:
+            return
+        now = time.monotonic()
+        if now - self._last_pos_update < 0.25:
             return
-        val = int((pos / self._duration) * 1000)
+        self._last_pos_update = now
+        self._last_slider_val = val
         self.slider_pos.blockSignals(True)
-        self.slider_pos.setValue(max(0, min(1000, val)))
+        self.slider_pos.setValue(val)
         self.slider_pos.blockSignals(False)
 
     @Slot(int)
@@ -0,0 +1,173 @@
+from __future__ import annotations
+import weakref
+from typing import Callable
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
+
+from models.dto import TrackRecommendation
+
+# bound str.format → 행마다 f-string을 새로 해석하지 않음
+_sim_fmt = "{:.2f}".format
+
+
+class TrackTableModel(QAbstractTableModel):
+    """
+    Read-only model over the current recommendation list.
+    Cells are produced on demand in data(), so no per-cell item objects exist.
+    """
+
+    HEADERS = ["#", "Track", "Artist", "Similarity", "Preview", "❤️", "Reason"]
+    COL_PREVIEW = 4
+    COL_FAV = 5
+    COL_REASON = 6
+
+    def __init__(self, is_favorite: Callable[[TrackRecommendation], bool], parent=None):
+        super().__init__(parent)
+        self._items: list[TrackRecommendation] = []
+        self._is_favorite = is_favorite
+
+    def set_items(self, items: list[TrackRecommendation]) -> None:
+        self.beginResetModel()
+        self._items = items
+        self.endResetModel()
+
+    def reorder(self, items: list[TrackRecommendation]) -> None:
+        """
+        Switch to a reordering (or subset) of the current items without a reset.
+        Persistent indexes follow their item, so the view keeps its selection.
+        """
+        self.layoutAboutToBeChanged.emit()
+        old = self._items
+        self._items = items
+        new_row = {id(it): r for r, it in enumerate(items)}
+        old_idx = self.persistentIndexList()
+        new_idx = []
+        for idx in old_idx:
+            r = new_row.get(id(old[idx.row()])) if idx.row() < len(old) else None
+            new_idx.append(self.index(r, idx.column()) if r is not None else QModelIndex())
+        self.changePersistentIndexList(old_idx, new_idx)
+        self.layoutChanged.emit()
+
+    def contains_all(self, items: list[TrackRecommendation]) -> bool:
+        current = {id(it) for it in self._items}
+        return all(id(it) in current for it in items)
+
+    def refresh_cell(self, row: int, col: int) -> None:
+        idx = self.index(row, col)
+        self.dataChanged.emit(idx, idx)
+
+    def item(self, row: int) -> TrackRecommendation | None:
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        it = self._items[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return str(it.rank)
+            if col == 1:
+                return it.track
+            if col == 2:
+                return it.artist
+            if col == 3:
+                sim = it.similarity
+                return _sim_fmt(sim) if sim is not None else "-"
+            if col == self.COL_PREVIEW:
+                return "Play" if it.preview_url else "N/A"
+            if col == self.COL_FAV:
+                return "♥" if self._is_favorite(it) else "♡"
+            if col == self.COL_REASON:
+                return it.reason or ""
+            return None
+
+        # button delegate: enabled 여부
+        if role == Qt.UserRole:
+            if col == self.COL_PREVIEW:
+                return bool(it.preview_url)
+            if col == self.COL_FAV:
+                return True
+            return None
+
+        if role == Qt.ToolTipRole:
+            if col == self.COL_FAV:
+                return "즐겨찾기 추가/해제"
+            if col == self.COL_REASON:
+                return it.reason or None
+
+        return None
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """
+    Paints a push button in the cell and calls on_click(row) on a left click.
+    Replaces one QPushButton widget per row.
+    on_click is held through a weak reference, so the delegate does not keep
+    the window alive; Qt.UserRole of the cell decides enabled/disabled.
+    """
+
+    def __init__(self, on_click: Callable[[int], None], parent=None):
+        super().__init__(parent)
+        self._on_click = weakref.WeakMethod(on_click) if hasattr(on_click, "__self__") else (lambda: on_click)
+        self._pressed: tuple[int, int] | None = None
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionButton()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.text = index.data(Qt.DisplayRole) or ""
+        if index.data(Qt.UserRole):
+            opt.state |= QStyle.State_Enabled
+        if self._pressed == (index.row(), index.column()):
+            opt.state |= QStyle.State_Sunken
+        else:
+            opt.state |= QStyle.State_Raised
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, opt, painter, option.widget)
+
+    def _repaint(self, option) -> None:
+        view = option.widget
+        if view is not None and hasattr(view, "viewport"):
+            view.viewport().update(option.rect)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        etype = event.type()
+        if etype not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        if event.button() != Qt.LeftButton or not index.data(Qt.UserRole):
+            return super().editorEvent(event, model, option, index)
+
+        cell = (index.row(), index.column())
+        inside = option.rect.contains(event.position().toPoint())
+
+        if etype == QEvent.MouseButtonPress:
+            if inside:
+                self._pressed = cell
+                self._repaint(option)
+            return super().editorEvent(event, model, option, index)
+
+        # release: press와 같은 셀 안에서 놓았을 때만 클릭
+        was_pressed = self._pressed == cell
+        self._pressed = None
+        self._repaint(option)
+        if was_pressed and inside:
+            cb = self._on_click()
+            if cb is not None:
+                cb(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
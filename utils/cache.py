@@ -1,21 +1,146 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
 import time
-from typing import Any, Dict, Tuple
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.fastjson import loads
+
+
+def make_key(prefix: str, params: Dict[str, Any]) -> str:
+    """
+    prefix + fixed-size digest of the canonical (sorted) params.
+    blake2b (not hash()) so keys stay stable across processes.
+    """
+    canon = repr(sorted(params.items())).encode("utf-8")
+    return prefix + hashlib.blake2b(canon, digest_size=16).hexdigest()
 
 
 class TTLCache:
-    def __init__(self, ttl_seconds: int = 600):
+    """
+    ttl_policy: {key prefix: ttl seconds}. The longest matching prefix wins,
+    keys without a match use ttl_seconds.
+    """
+
+    def __init__(self, ttl_seconds: int = 600, ttl_policy: Optional[Dict[str, int]] = None):
         self.ttl = ttl_seconds
+        # longest prefix first
+        self._policy = sorted((ttl_policy or {}).items(), key=lambda kv: len(kv[0]), reverse=True)
         self._store: Dict[str, Tuple[float, Any]] = {}
 
+    def ttl_for(self, key: str) -> int:
+        for prefix, ttl in self._policy:
+            if key.startswith(prefix):
+                return ttl
+        return self.ttl
+
     def get(self, key: str):
         item = self._store.get(key)
         if not item:
             return None
-        ts, val = item
-        if time.time() - ts > self.ttl:
+        expires_at, val = item
+        if time.time() > expires_at:
             self._store.pop(key, None)
             return None
         return val
 
-    def set(self, key: str, value: Any):
-        self._store[key] = (time.time(), value)
+    def _expires_at(self, key: str, ttl: Optional[int]) -> float:
+        if ttl is None:
+            ttl = self.ttl_for(key)
+        return time.time() + ttl
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        self._store[key] = (self._expires_at(key, ttl), value)
+
+
+class PersistentTTLCache(TTLCache):
+    """
+    TTLCache backed by a local SQLite file, so entries survive app restarts.
+    The in-memory dict stays in front; values must be JSON-serializable.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int = 600, ttl_policy: Optional[Dict[str, int]] = None):
+        super().__init__(ttl_seconds=ttl_seconds, ttl_policy=ttl_policy)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self._db.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+        self._db.commit()
+
+    def get(self, key: str):
+        val = super().get(key)
+        if val is not None:
+            return val
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT expires_at, value FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row:
+            return None
+        expires_at, raw = row
+        if time.time() > expires_at:
+            return None
+        val = loads(raw)
+        self._store[key] = (expires_at, val)
+        return val
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        expires_at = self._expires_at(key, ttl)
+        self._store[key] = (expires_at, value)
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                    (key, expires_at, json.dumps(value, ensure_ascii=False)),
+                )
+                self._db.commit()
+        except sqlite3.Error:
+            pass  # disk 실패 시 메모리 캐시로만 동작
+
+
+class InFlight:
+    """
+    Coalesces identical concurrent calls:
+    while a call for `key` is running, other callers wait for its result
+    instead of issuing the same HTTP request again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            fut = self._calls.get(key)
+            owner = fut is None
+            if owner:
+                fut = Future()
+                self._calls[key] = fut
+
+        if not owner:
+            return fut.result()
+
+        try:
+            val = fn()
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        else:
+            fut.set_result(val)
+            return val
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
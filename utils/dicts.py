@@ -0,0 +1,16 @@
+from typing import Any
+
+
+def dig(d: Any, *keys: str, default: Any = None) -> Any:
+    """
+    Nested dict lookup without allocating throwaway dicts:
+    dig(r, "artist", "name") == ((r or {}).get("artist") or {}).get("name")
+    Returns `default` as soon as a level is missing or not a dict.
+    """
+    for k in keys:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(k)
+        if d is None:
+            return default
+    return d
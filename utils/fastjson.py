@@ -0,0 +1,40 @@
+from __future__ import annotations
+import mmap
+from typing import Any
+
+# orjson(C 구현) 있으면 사용, 없으면 stdlib json (그때만 import)
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+    import json
+
+# 이보다 큰 파일은 mmap → read() 버퍼 복사 없이 orjson에 넘김 (작은 파일은 read가 더 쌈)
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """UTF-8 JSON bytes (non-ASCII kept as-is); indent=True → 2-space pretty print."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def load_file(path: str, size: int) -> Any:
+    """
+    Parse the JSON file at path (size = its st_size, from a stat the caller already did).
+    Large files are mmap'ed and parsed in place when orjson is available.
+    """
+    with open(path, "rb") as f:
+        if orjson is None or size < MMAP_MIN_SIZE:
+            return loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as mv:
+            return orjson.loads(mv)
@@ -1,18 +1,25 @@
 from __future__ import annotations
-import json
+import logging
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import asdict
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set, Tuple
+
+from utils.fastjson import loads, dumps
+from utils.fileio import atomic_write
+from utils.keys import normalize_key
+
+
+logger = logging.getLogger(__name__)
 
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def normalize_key(track: str, artist: str) -> str:
-    t = (track or "").strip().lower()
-    a = (artist or "").strip().lower()
-    return f"{t}|||{a}"
+# track/artist 둘 다 비었을 때의 key (str.strip("|||")은 부분문자열이 아니라 문자 집합을 지움)
+_EMPTY_KEY = normalize_key("", "")
 
 
 class FavoritesStore:
@@ -34,18 +41,93 @@ class FavoritesStore:
         ...
       ]
     }
+
+    favorites.log (JSON lines, replayed on top of favorites.json):
+    {"op": "add", "item": {...}}
+    {"op": "rm", "key": "<normalize_key>"}
     """
 
+    FLUSH_DELAY = 0.5
+    # favorites.log가 이 줄 수를 넘으면 favorites.json으로 합치고 log 비움
+    COMPACT_LINES = 100
+
     def __init__(self, filepath: str):
         self.filepath = filepath
+        # 변경은 JSON-lines로 append만 (토글당 O(1)); favorites.json은 compact 시에만 다시 씀
+        self.logpath = os.path.splitext(filepath)[0] + ".log"
         ensure_dir(os.path.dirname(filepath))
+        # key -> item (파일 순서 유지). None = 아직 안 읽음. 쓰기 시 갱신, invalidate()로 다시 읽기
+        self._cache: OrderedDict[str, Dict[str, Any]] | None = None
+        # favorite_artists()/favorite_tags()용 파생 set (items 캐시와 함께 무효화)
+        self._sets: Tuple[Set[str], Set[str]] | None = None
+        # 연속 토글은 FLUSH_DELAY 동안 모아서 한 번만 기록 (timer thread ↔ UI thread → lock)
+        self._lock = threading.RLock()
+        self._pending: List[Dict[str, Any]] = []   # 아직 log에 안 쓴 op
+        self._needs_compact = False               # save()/clear(): log로 표현 못 함 → snapshot
+        self._log_lines = 0
+        self._timer: threading.Timer | None = None
+        # 마지막으로 읽거나 쓴 favorites.json의 (mtime_ns, size) → reload_if_changed()에서 비교
+        self._stamp: Tuple[int, int] | None = None
 
     def load(self) -> List[Dict[str, Any]]:
+        """
+        Returns the favorite items (read from disk only on first use/after invalidate()).
+        """
+        return list(self._entries().values())
+
+    def _entries(self) -> OrderedDict[str, Dict[str, Any]]:
+        if self._cache is None:
+            self._stamp = self._file_stamp()
+            m = self._keyed(self._read())
+            self._log_lines = self._replay_log(m)
+            self._cache = m
+        return self._cache
+
+    def _replay_log(self, m: OrderedDict[str, Dict[str, Any]]) -> int:
+        if not os.path.exists(self.logpath):
+            return 0
+        n = 0
+        try:
+            with open(self.logpath, "rb") as f:
+                for line in f:
+                    n += 1
+                    try:
+                        op = loads(line)
+                    except ValueError:
+                        # 기록 중 종료로 잘린 줄 → 이어 쓰면 다음 줄까지 깨지므로 다음 flush에서 compact
+                        self._needs_compact = True
+                        continue
+                    if isinstance(op, dict):
+                        self._apply(m, op)
+        except OSError:
+            pass
+        return n
+
+    @staticmethod
+    def _apply(m: OrderedDict[str, Dict[str, Any]], op: Dict[str, Any]) -> None:
+        if op.get("op") == "add" and isinstance(op.get("item"), dict):
+            it = op["item"]
+            key = normalize_key(it.get("track", ""), it.get("artist", ""))
+            if key != _EMPTY_KEY:
+                m[key] = it
+        elif op.get("op") == "rm":
+            m.pop(op.get("key"), None)
+
+    @staticmethod
+    def _keyed(items: List[Dict[str, Any]]) -> OrderedDict[str, Dict[str, Any]]:
+        m: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        for it in items:
+            key = normalize_key(it.get("track", ""), it.get("artist", ""))
+            if key != _EMPTY_KEY:
+                m[key] = it
+        return m
+
+    def _read(self) -> List[Dict[str, Any]]:
         if not os.path.exists(self.filepath):
             return []
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.filepath, "rb") as f:
+                data = loads(f.read())
             items = data.get("items", [])
             if isinstance(items, list):
                 return items
@@ -53,40 +135,132 @@ class FavoritesStore:
         except Exception:
             return []
 
+    def _file_stamp(self) -> Tuple[int, int] | None:
+        try:
+            st = os.stat(self.filepath)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def reload_if_changed(self) -> bool:
+        """invalidate() only if favorites.json changed on disk since it was last read/written."""
+        with self._lock:
+            if self._cache is None or self._file_stamp() == self._stamp:
+                return False
+            self.invalidate()
+            return True
+
+    def invalidate(self) -> None:
+        """Drop the in-memory copy (e.g. after favorites.json was edited externally)."""
+        with self._lock:
+            self._sets = None
+            if self._cache is None or self._file_stamp() == self._stamp:
+                # 디스크가 그대로 → 아직 안 쓴 변경을 먼저 기록하면 다시 읽어도 유실 없음
+                self.flush()
+                self._cache = None
+                return
+            # 외부에서 고친 파일 위에 옛 snapshot을 compact하면 그 수정이 사라짐
+            # → 새로 읽고, 아직 안 쓴 add/rm op만 그 위에 다시 적용해 log로 append
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = self._pending
+            if self._needs_compact:
+                logger.warning("favorites.json changed on disk; discarding unsaved clear/save")
+            self._pending = []
+            self._needs_compact = False
+            self._cache = None
+            m = self._entries()
+            for op in pending:
+                self._apply(m, op)
+            self._pending = pending
+            self.flush()
+
     def save(self, items: List[Dict[str, Any]]) -> None:
-        payload = {"version": 1, "items": items}
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        """Replace all favorites and write immediately."""
+        with self._lock:
+            self._cache = self._keyed(items)
+            self._sets = None
+            self._pending = []
+            self._needs_compact = True
+            self.flush()
+
+    def save_soon(self) -> None:
+        """(Re)start the debounce timer; the write happens FLUSH_DELAY after the last change."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self, compact: bool = False) -> None:
+        """
+        Write pending changes now: append them to favorites.log, or rewrite favorites.json
+        when compact=True / the log grew past COMPACT_LINES (call with compact=True on close).
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._cache is None:
+                return
+            if not (self._pending or self._needs_compact or (compact and self._log_lines)):
+                return
+            if compact or self._needs_compact or self._log_lines + len(self._pending) > self.COMPACT_LINES:
+                self._compact()
+                return
+            data = b"".join(dumps(op) + b"\n" for op in self._pending)
+            with open(self.logpath, "ab") as f:
+                f.write(data)
+            self._log_lines += len(self._pending)
+            self._pending = []
+
+    def _compact(self) -> None:
+        payload = {"version": 1, "items": list(self._cache.values())}
+        # snapshot을 먼저 atomic하게 쓴 뒤 log 삭제 (그 사이 종료돼도 replay는 멱등)
+        atomic_write(self.filepath, dumps(payload, indent=True))
+        self._stamp = self._file_stamp()
+        if os.path.exists(self.logpath):
+            os.remove(self.logpath)
+        self._log_lines = 0
+        self._pending = []
+        self._needs_compact = False
+
+    def _changed(self, op: Dict[str, Any] | None) -> None:
+        self._sets = None
+        if op is None:
+            self._pending = []
+            self._needs_compact = True
+        else:
+            self._pending.append(op)
+        self.save_soon()
 
     def to_map(self) -> Dict[str, Dict[str, Any]]:
         """
-        key -> item dict
+        key -> item dict (a copy; the UI edits its own map on toggle)
         """
-        items = self.load()
-        m: Dict[str, Dict[str, Any]] = {}
-        for it in items:
-            key = normalize_key(it.get("track", ""), it.get("artist", ""))
-            if key.strip("|||"):
-                m[key] = it
-        return m
+        with self._lock:
+            return dict(self._entries())
 
     def upsert(self, item_dict: Dict[str, Any]) -> None:
-        m = self.to_map()
         key = normalize_key(item_dict.get("track", ""), item_dict.get("artist", ""))
-        if not key.strip("|||"):
+        if key == _EMPTY_KEY:
             return
-        m[key] = item_dict
-        self.save(list(m.values()))
+        with self._lock:
+            self._entries()[key] = item_dict
+            self._changed({"op": "add", "item": item_dict})
 
     def remove(self, track: str, artist: str) -> None:
-        m = self.to_map()
-        key = normalize_key(track, artist)
-        if key in m:
-            m.pop(key, None)
-            self.save(list(m.values()))
+        with self._lock:
+            key = normalize_key(track, artist)
+            if self._entries().pop(key, None) is not None:
+                self._changed({"op": "rm", "key": key})
 
     def clear(self) -> None:
-        self.save([])
+        with self._lock:
+            self._cache = OrderedDict()
+            self._changed(None)
 
     def export_snapshot_from_reco(self, reco_obj) -> Dict[str, Any]:
         """
@@ -103,15 +277,22 @@ class FavoritesStore:
             d["tags"] = []
         return d
 
+    def _derived_sets(self) -> Tuple[Set[str], Set[str]]:
+        if self._sets is None:
+            items = self._entries().values()
+            artists = {str(it.get("artist", "")).strip().lower() for it in items if it.get("artist")}
+            tags = set()
+            for it in items:
+                for t in it.get("tags", []) or []:
+                    if t:
+                        tags.add(str(t).strip().lower())
+            self._sets = (artists, tags)
+        return self._sets
+
     def favorite_artists(self) -> set[str]:
-        items = self.load()
-        return {str(it.get("artist", "")).strip().lower() for it in items if it.get("artist")}
+        """Cached set; do not mutate."""
+        return self._derived_sets()[0]
 
     def favorite_tags(self) -> set[str]:
-        items = self.load()
-        tags = set()
-        for it in items:
-            for t in it.get("tags", []) or []:
-                if t:
-                    tags.add(str(t).strip().lower())
-        return tags
+        """Cached set; do not mutate."""
+        return self._derived_sets()[1]
@@ -1,17 +1,17 @@
 from __future__ import annotations
-import json
 import os
+import time
 from typing import Dict, Tuple
 
+from utils.fastjson import loads, dumps
+from utils.fileio import atomic_write
+from utils.keys import normalize_key
+
 
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def normalize_key(track: str, artist: str) -> str:
-    return f"{track.strip().lower()}|{artist.strip().lower()}"
-
-
 class FeedbackStore:
     def __init__(self, filepath: str):
         self.filepath = filepath
@@ -24,16 +24,44 @@ class FeedbackStore:
             self._data = {}
             return
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
+            with open(self.filepath, "rb") as f:
+                self._data = loads(f.read())
             if not isinstance(self._data, dict):
                 self._data = {}
         except Exception:
             self._data = {}
+            return
+        if self._migrate_legacy_keys():
+            self.save()
+
+    def _migrate_legacy_keys(self) -> bool:
+        """
+        Older files keyed records as "track|artist"; rewrite them to utils.keys.normalize_key
+        (merging counts if several keys fold into one; "last" comes from the record
+        with the newest "ts"). Returns True if anything changed.
+        """
+        legacy = [k for k in self._data if "|||" not in k and "|" in k]
+        for old in legacy:
+            rec = self._data.pop(old)
+            track, _, artist = old.rpartition("|")
+            key = normalize_key(track, artist)
+            cur = self._data.get(key)
+            if cur is None:
+                self._data[key] = rec
+                continue
+            cur["like"] = int(cur.get("like", 0)) + int(rec.get("like", 0))
+            cur["dislike"] = int(cur.get("dislike", 0)) + int(rec.get("dislike", 0))
+            # ts 없는 예전 기록은 가장 오래된 것으로 취급 (ISO 문자열 → 문자열 비교로 충분)
+            rec_ts, cur_ts = str(rec.get("ts", "") or ""), str(cur.get("ts", "") or "")
+            if rec.get("last") and (rec_ts > cur_ts or not cur.get("last")):
+                cur["last"] = rec["last"]
+                if rec_ts:
+                    cur["ts"] = rec_ts
+        return bool(legacy)
 
     def save(self):
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        # like/dislike마다 저장 → 잘린 파일이면 load()가 전체 피드백을 잃으므로 atomic
+        atomic_write(self.filepath, dumps(self._data, indent=True))
 
     def clear(self):
         self._data = {}
@@ -58,6 +86,7 @@ class FeedbackStore:
         rec = self._data.get(key, {"like": 0, "dislike": 0})
         rec["like"] = int(rec.get("like", 0)) + 1
         rec["last"] = "like"
+        rec["ts"] = time.strftime("%Y-%m-%dT%H:%M:%S")
         self._data[key] = rec
         self.save()
 
@@ -66,6 +95,7 @@ class FeedbackStore:
         rec = self._data.get(key, {"like": 0, "dislike": 0})
         rec["dislike"] = int(rec.get("dislike", 0)) + 1
         rec["last"] = "dislike"
+        rec["ts"] = time.strftime("%Y-%m-%dT%H:%M:%S")
         self._data[key] = rec
         self.save()
 
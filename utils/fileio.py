@@ -0,0 +1,17 @@
+from __future__ import annotations
+import os
+
+
+def atomic_write(path: str, data: str | bytes) -> None:
+    """
+    Write data to a sibling temp file, then os.replace() it over path.
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    tmp = path + ".tmp"
+    if isinstance(data, bytes):
+        with open(tmp, "wb") as f:
+            f.write(data)
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+    os.replace(tmp, path)
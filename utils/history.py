@@ -1,8 +1,13 @@
 from __future__ import annotations
-import json
+import contextlib
 import os
-from datetime import datetime
-from typing import List, Dict, Any
+import sys
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+from utils.fastjson import dumps, loads, load_file
+from utils.fileio import atomic_write
 
 
 def ensure_dir(path: str) -> None:
@@ -15,44 +20,187 @@ class SearchHistoryStore:
     {
       "version": 1,
       "items": [
-        {"q": "The Weeknd", "ts": "2026-01-20T12:34:56"},
+        {"q": "The Weeknd", "qlow": "the weeknd", "ts": "2026-01-20T12:34:56"},
         ...
       ]
     }
+
+    history.log (JSON lines, one added item per line, oldest first;
+    replayed on top of history.json):
+    {"q": "The Weeknd", "qlow": "the weeknd", "ts": "2026-01-20T12:34:56"}
     """
     def __init__(self, filepath: str, max_items: int = 50):
         self.filepath = filepath
         self.max_items = max_items
+        # add()는 log에 한 줄 append만 (O(1)); history.json은 log가 max_items*2 줄을 넘으면 다시 씀
+        self.logpath = os.path.splitext(filepath)[0] + ".log"
         ensure_dir(os.path.dirname(filepath))
+        # q.casefold() -> item (newest first) + 그때의 (json, log) mtime → 둘 다 그대로면 다시 읽지 않음
+        self._cache: Optional[OrderedDict[str, Dict[str, Any]]] = None
+        self._stamp: Optional[tuple] = None
+        self._log_lines = 0
+        self._needs_compact = False
+        self._pending: List[Dict[str, Any]] = []
+        # batch() 안에서는 add()가 기록을 미루고, 가장 바깥 batch가 끝날 때 한 번만 save
+        self._batch_depth = 0
+        self._dirty = False
 
     def load(self) -> List[Dict[str, Any]]:
-        if not os.path.exists(self.filepath):
-            return []
+        """Returns the history items, newest first (re-read only if the file changed)."""
+        return list(self._entries().values())
+
+    @staticmethod
+    def _stat(path: str) -> Optional[os.stat_result]:
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def _current_stamp(self) -> tuple:
+        st, lst = self._stat(self.filepath), self._stat(self.logpath)
+        return (st and st.st_mtime_ns, lst and lst.st_mtime_ns), st, lst
+
+    def _entries(self) -> OrderedDict[str, Dict[str, Any]]:
+        stamp, st, lst = self._current_stamp()
+        if self._cache is not None and stamp == self._stamp:
+            return self._cache
+        if st is None or st.st_size < 4:
+            # 빈 파일/쓰다 만 파일: items를 담을 수 없는 크기 → parser 호출 없이 빈 history
+            items = []
+        else:
+            try:
+                data = load_file(self.filepath, st.st_size)
+                items = data.get("items", [])
+                # max_items가 줄어든 뒤의 파일이라도 key화/dedup은 최대 max_items개까지만
+                items = items[: self.max_items] if isinstance(items, list) else []
+            except Exception:
+                items = []
+        od = self._keyed(items)
+        self._needs_compact = False
+        self._log_lines = self._replay_log(od) if lst is not None else 0
+        while len(od) > self.max_items:
+            od.popitem(last=True)
+        self._cache, self._stamp = od, stamp
+        return self._cache
+
+    def _replay_log(self, od: OrderedDict[str, Dict[str, Any]]) -> int:
+        n = 0
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            items = data.get("items", [])
-            return items if isinstance(items, list) else []
-        except Exception:
-            return []
+            with open(self.logpath, "rb") as f:
+                for line in f:
+                    n += 1
+                    try:
+                        it = loads(line)
+                    except ValueError:
+                        # 기록 중 종료로 잘린 줄 → 뒤에 이어 쓰지 않고 다음 add에서 compact
+                        self._needs_compact = True
+                        continue
+                    if isinstance(it, dict):
+                        self._push(od, it)
+        except OSError:
+            pass
+        return n
+
+    @staticmethod
+    def _key(it: Dict[str, Any]) -> str:
+        """Intern q/qlow of a loaded item in place and return qlow."""
+        # 같은 검색어가 json/log/UI에 여러 번 나옴 → intern해서 문자열 하나만 공유, == 비교도 포인터로 끝남
+        q = it.get("q")
+        q = it["q"] = sys.intern(q) if isinstance(q, str) else str(q or "")
+        qlow = it.get("qlow")
+        if not isinstance(qlow, str):
+            # 예전 항목(qlow 없음)은 한 번만 계산해 채워 둠 → 다음 save부터 파일에 포함
+            qlow = q.casefold()
+        qlow = it["qlow"] = sys.intern(qlow)
+        return qlow
+
+    @classmethod
+    def _push(cls, od: OrderedDict[str, Dict[str, Any]], it: Dict[str, Any]) -> None:
+        qlow = cls._key(it)
+        od.pop(qlow, None)
+        od[qlow] = it
+        od.move_to_end(qlow, last=False)
+
+    @classmethod
+    def _keyed(cls, items: List[Dict[str, Any]]) -> OrderedDict[str, Dict[str, Any]]:
+        od: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        for it in items:
+            qlow = cls._key(it)
+            if qlow not in od:
+                od[qlow] = it
+        return od
 
     def save(self, items: List[Dict[str, Any]]) -> None:
-        payload = {"version": 1, "items": items[: self.max_items]}
-        with open(self.filepath, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        self._cache = self._keyed(items)
+        self._write()
 
-    def add(self, q: str) -> None:
+    def _write(self) -> None:
+        """Compact: rewrite history.json from the cache and drop history.log."""
+        od = self._cache
+        while len(od) > self.max_items:
+            od.popitem(last=True)
+        payload = {"version": 1, "items": list(od.values())}
+        # 기본은 compact (크기 ~1/2, C encoder 경로); 디버깅용 pretty는 HISTORY_PRETTY=1
+        # fastjson.dumps는 UTF-8 bytes → "wb"로 한 번 write (orjson이면 encode 단계도 없음)
+        atomic_write(self.filepath, dumps(payload, indent=os.getenv("HISTORY_PRETTY") == "1"))
+        # snapshot을 먼저 쓴 뒤 log 삭제 (그 사이 종료돼도 replay는 멱등)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.logpath)
+        self._log_lines = 0
+        self._needs_compact = False
+        self._pending = []
+        self._stamp = self._current_stamp()[0]
+
+    def _append(self) -> None:
+        pending = self._pending
+        if self._needs_compact or self._log_lines + len(pending) > self.max_items * 2:
+            self._write()
+            return
+        with open(self.logpath, "ab") as f:
+            f.write(b"".join(dumps(it) + b"\n" for it in pending))
+        self._log_lines += len(pending)
+        self._pending = []
+        self._stamp = self._current_stamp()[0]
+
+    def add(self, q: str, ts: Optional[str] = None) -> bool:
+        """Record q as the newest entry. Returns False if history did not change."""
         q = (q or "").strip()
         if not q:
-            return
-        items = self.load()
+            return False
+        od = self._entries()
 
-        # de-dup: remove existing q (case-insensitive)
-        qlow = q.lower()
-        items = [it for it in items if str(it.get("q", "")).lower() != qlow]
+        # de-dup (case-insensitive): 기존 항목을 빼고 맨 앞에 다시 넣음 → O(1) LRU
+        q = sys.intern(q)
+        qlow = sys.intern(q.casefold())
+        # ts를 이미 가진 호출자는 넘기면 됨; 없으면 C 레벨 strftime 한 번 (isoformat(timespec=) 대신)
+        it = {"q": q, "qlow": qlow, "ts": ts or time.strftime("%Y-%m-%dT%H:%M:%S")}
+        # add는 맨 앞만 바꿈 → 맨 앞이 같은 q/ts(같은 초 안의 재검색)면 결과가 동일하니 기록 생략
+        head = next(iter(od.values()), None)
+        if head is not None and head.get("q") == q and head.get("ts") == it["ts"]:
+            return False
+        od.pop(qlow, None)
+        od[qlow] = it
+        od.move_to_end(qlow, last=False)
+        while len(od) > self.max_items:
+            od.popitem(last=True)
+        self._pending.append(it)
+        if self._batch_depth:
+            self._dirty = True
+            return True
+        self._append()
+        return True
 
-        items.insert(0, {"q": q, "ts": datetime.now().isoformat(timespec="seconds")})
-        self.save(items)
+    @contextlib.contextmanager
+    def batch(self):
+        """Group several add() calls into a single file write."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self._append()
 
     def clear(self) -> None:
         self.save([])
@@ -0,0 +1,11 @@
+from __future__ import annotations
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def normalize_key(track: str, artist: str) -> str:
+    """
+    Shared (track, artist) identity key for favorites and feedback.
+    Cached: the same pairs are keyed repeatedly per session (rerank, is_favorite, toggle).
+    """
+    return f"{(track or '').strip().casefold()}|||{(artist or '').strip().casefold()}"
@@ -1,12 +1,47 @@
+from __future__ import annotations
 import re
-from typing import Tuple, Optional
+
+# 모듈 로드 시 한 번만 compile (호출마다 re 내부 캐시 조회 생략)
+# 끝에 붙은 "(Remastered 2011)" / "[feat. X]" / " - Radio Edit" 같은 edition 표기만; 중간의 괄호나
+# live/remix/acoustic 등 다른 녹음을 뜻하는 표기는 남겨 둠 (다른 곡과 같은 key가 되지 않게)
+_EDITION_WORDS = r"\b(?:remaster(?:ed)?|edit|version|explicit|clean|mono|stereo|deluxe|bonus|single|feat|ft)\b"
+_OTHER_TAKE = r"\b(?:live|remix|mix|acoustic|demo|instrumental|karaoke|cover)\b"
+_EDITION_SUFFIX_RE = re.compile(
+    r"(?:"
+    # "(Remastered 2011)" / "[Radio Edit]"
+    rf"\s*[\(\[](?![^\)\]]*{_OTHER_TAKE})[^\)\]]*{_EDITION_WORDS}[^\)\]]*[\)\]]"
+    r"|"
+    # " - Remastered 2011" / " – Single Version"
+    rf"\s+[-—–]\s+(?![^-—–\(\)\[\]]*{_OTHER_TAKE})[^-—–\(\)\[\]]*{_EDITION_WORDS}[^-—–\(\)\[\]]*"
+    r")\s*$",
+    re.IGNORECASE,
+)
+# " by " / " - " / " — " / " – " 을 한 패턴으로: 앞뒤 공백은 lookaround라 겹친 구분자도 놓치지 않음
+_SEP_RE = re.compile(r"(?<= )(?:(?P<by>by)|[-—–])(?= )", re.IGNORECASE)
 
 
 def normalize_space(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # 인자 없는 split()은 공백 run 단위로 자르고 앞뒤 공백/빈 조각을 버림 (regex 불필요)
+    return " ".join((s or "").split())
+
+
+def normalize_title(s: str) -> str:
+    """
+    Title key for loose matching across providers:
+    casefold + drop trailing edition suffixes such as "(Remastered)" / "[Radio Edit]"
+    / " - Remastered 2011".
+    Brackets inside the title and live/remix/acoustic markers are kept.
+    """
+    t = (s or "").rstrip()
+    # "Song (feat. X) [Remastered]" 처럼 여러 개 붙은 경우 → 끝에서부터 반복
+    m = _EDITION_SUFFIX_RE.search(t)
+    while m:
+        t = t[: m.start()]
+        m = _EDITION_SUFFIX_RE.search(t)
+    return normalize_space(t).casefold()
 
 
-def parse_user_query(text: str) -> Tuple[Optional[str], Optional[str]]:
+def parse_user_query(text: str) -> tuple[str | None, str | None]:
     """
     returns (track, artist)
     - "Track - Artist"
@@ -18,18 +53,17 @@ def parse_user_query(text: str) -> Tuple[Optional[str], Optional[str]]:
     if not t:
         return None, None
 
-    # Track by Artist
-    m = re.match(r"^(?P<track>.+?)\s+by\s+(?P<artist>.+)$", t, flags=re.IGNORECASE)
-    if m:
-        return normalize_space(m.group("track")), normalize_space(m.group("artist"))
-
-    # Track - Artist (including em dash)
-    for sep in [" - ", " — ", " – "]:
-        if sep in t:
-            left, right = t.split(sep, 1)
-            left, right = normalize_space(left), normalize_space(right)
-            if left and right:
-                return left, right
+    # 한 번의 scan: 첫 " by "가 있으면 우선, 없으면 가장 앞의 dash
+    # (t는 이미 공백 정리 + strip 상태 → 구분자 양쪽은 항상 비어 있지 않음)
+    dash = None
+    for m in _SEP_RE.finditer(t):
+        if m.group("by"):
+            dash = m
+            break
+        if dash is None:
+            dash = m
+    if dash is not None:
+        return t[: dash.start() - 1], t[dash.end() + 1:]
 
     # if only one chunk, treat as artist (fallback)
     return None, t